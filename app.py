@@ -1,12 +1,55 @@
 # main.py - Main application entry point
-import tkinter as tk
-from tkinter import messagebox
-from drug_study_app import DrugStudyApp
+import argparse
+
+from startup_profiler import StartupProfiler
+
+
+def import_progress(json_path, profile):
+    """Replace a profile's progress database contents with a JSON progress file"""
+    import os
+
+    from study_core import SQLiteProgressStore, import_json_progress, profile_path
+
+    db_path = profile_path(profile)
+    os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+    store = SQLiteProgressStore(db_path)
+    store.connect()
+    try:
+        if import_json_progress(json_path, store):
+            progress = store.load(1)
+            print(f"Imported {len(progress['session_history'])} sessions and "
+                  f"{len(progress['drug_performance'])} drug counters into {store.path}")
+        else:
+            print(f"No progress found in {json_path}")
+    finally:
+        store.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Drug Study Platform")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="print an import and init timing breakdown")
+    parser.add_argument("--profile", default="default",
+                        help="whose progress to load (each profile has its own database)")
+    parser.add_argument("--import-progress", metavar="JSON",
+                        help="copy a study_progress.json file into the profile's database and exit")
+    args = parser.parse_args()
+
+    if args.import_progress:
+        import_progress(args.import_progress, args.profile)
+        return
+
+    profiler = StartupProfiler(enabled=args.profile_startup)
 
-if __name__ == "__main__":
     try:
-        app = DrugStudyApp()
+        with profiler.step("import drug_study_app"):
+            from drug_study_app import DrugStudyApp
+        app = DrugStudyApp(profiler=profiler, profile=args.profile)
         app.run()
     except Exception as e:
         print(f"Failed to start application: {str(e)}")
         input("Press Enter to exit...")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+# bench_answer_matching.py - Answer checking accuracy and latency: legacy heuristic vs indexed matcher
+import argparse
+import csv
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from study_core import ANSWER_FIELDS, AnswerIndex, check_answer, load_catalog
+from study_core.answers import DEFAULT_RULE, FIELD_RULES, PARENTHESES_PATTERN, Alternatives, normalize_tokens
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def legacy_check_answer(user_answer, correct_answer):
+    """Previous check_answer: substring test plus any shared word longer than 3 letters"""
+    user_answer = user_answer.strip().lower()
+    correct_answer = correct_answer.strip().lower()
+
+    if user_answer in correct_answer or correct_answer in user_answer:
+        return True
+    if len(user_answer) > 3 and any(word in correct_answer.split()
+                                    for word in user_answer.split() if len(word) > 3):
+        return True
+    return False
+
+
+def typo(text, rng):
+    """Apply one random substitution, deletion, insertion or transposition"""
+    i = rng.randrange(1, len(text) - 1)
+    kind = rng.choice("sdit")
+    letter = rng.choice("aeiourstln")
+    if kind == "s":
+        return text[:i] + letter + text[i + 1:]
+    if kind == "d":
+        return text[:i] + text[i + 1:]
+    if kind == "i":
+        return text[:i] + letter + text[i:]
+    return text[:i - 1] + text[i] + text[i - 1] + text[i + 1:]
+
+
+def single_word(field, value, rng):
+    """One word of a multi-word alternative that is not an accepted answer on its own, or None
+
+    One-word alternatives (including first words of brand names and
+    parenthesized abbreviations) are skipped, since the matcher accepts them
+    by design.
+    """
+    rule = FIELD_RULES.get(field, DEFAULT_RULE)
+    accepted = {tokens[0] for tokens in Alternatives(value, rule).items.values() if len(tokens) == 1}
+    words = [word for part in rule.split_pattern.split(value)
+             for tokens in [normalize_tokens(PARENTHESES_PATTERN.sub(" ", part))] if len(tokens) > 1
+             for word in tokens if len(word) > 3 and word not in accepted]
+    return rng.choice(words) if words else None
+
+
+def synthetic_corpus(catalog, rng):
+    """Return (field, correct answer, user answer, expected, kind) rows built from the catalog
+
+    Positives: the exact value, one listed alternative, one typo'd
+    alternative. Negatives: an unrelated value from another drug, one word
+    of the answer padded with an unrelated word, one bare word of a
+    multi-word alternative, and an empty answer.
+    """
+    corpus = []
+    for field in ANSWER_FIELDS:
+        values = catalog.columns[field]
+        for row, value in enumerate(values):
+            parts = [part.strip() for part in value.split(",") if part.strip()]
+            if not parts:
+                continue
+            tokens = set(normalize_tokens(value))
+            part = rng.choice(parts)
+            corpus.append((field, value, value, True, "exact"))
+            corpus.append((field, value, part, True, "alternative"))
+            if len(part) >= 6:
+                corpus.append((field, value, typo(part, rng), True, "typo"))
+
+            unrelated = [p.strip() for other in rng.sample(values, min(20, len(values)))
+                         for p in other.split(",") if p.strip() and not tokens & set(normalize_tokens(p))]
+            if unrelated:
+                corpus.append((field, value, rng.choice(unrelated), False, "other drug"))
+                words = [word for word in value.split() if len(word.strip(",")) > 3]
+                if words:
+                    filler = rng.choice(unrelated).split()[0]
+                    corpus.append((field, value, f"{rng.choice(words).strip(',')} {filler}", False, "shared word"))
+            word = single_word(field, value, rng)
+            if word:
+                corpus.append((field, value, word, False, "single word"))
+            corpus.append((field, value, "", False, "empty"))
+    return corpus
+
+
+def read_corpus(path):
+    """Read recorded answers: CSV with field, correct_answer, user_answer, expected (1/0)"""
+    with open(path, newline='', encoding='utf-8') as f:
+        return [(row['field'], row['correct_answer'], row['user_answer'],
+                 row['expected'].strip().lower() in ("1", "true", "yes"), "recorded")
+                for row in csv.DictReader(f)]
+
+
+def evaluate(name, check, corpus):
+    """Print accuracy per kind and the mean time per check"""
+    by_kind = {}
+    start = time.perf_counter()
+    for field, correct, user, expected, kind in corpus:
+        hits, total = by_kind.get(kind, (0, 0))
+        by_kind[kind] = (hits + (check(user, correct, field) == expected), total + 1)
+    elapsed = time.perf_counter() - start
+
+    right = sum(hits for hits, _ in by_kind.values())
+    detail = "  ".join(f"{kind} {hits / total:5.1%}" for kind, (hits, total) in by_kind.items())
+    print(f"{name:>10}: {right / len(corpus):6.1%} correct  {elapsed * 1e6 / len(corpus):6.1f} us/check  {detail}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--catalog", default=os.path.join(ROOT, "drugs.csv"))
+    parser.add_argument("--corpus", help="CSV of recorded answers (field, correct_answer, user_answer, expected)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    catalog = load_catalog(args.catalog)
+    if args.corpus:
+        corpus = read_corpus(args.corpus)
+    else:
+        print("No recorded corpus given; using synthetic answers generated from the catalog")
+        corpus = synthetic_corpus(catalog, random.Random(args.seed))
+
+    index = AnswerIndex(catalog)
+    start = time.perf_counter()
+    index.build(ANSWER_FIELDS)
+    print(f"{len(corpus)} answers; index built in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    evaluate("legacy", lambda user, correct, field: legacy_check_answer(user, correct), corpus)
+    evaluate("unindexed", check_answer, corpus)
+    evaluate("indexed", index.check, corpus)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# bench_catalog_load.py - Catalog parsing throughput: legacy readlines/split vs streaming parser
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from study_core import CATALOG_COLUMNS, load_catalog
+
+
+def write_synthetic_catalog(path, num_rows, rows_per_section=50):
+    """Write a catalog with quoted fields (no embedded commas so the legacy path can parse it)"""
+    rng = random.Random(42)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(",".join(CATALOG_COLUMNS) + "\n")
+        for i in range(num_rows):
+            if i % rows_per_section == 0:
+                f.write(f"\n# SECTION {i // rows_per_section}\n")
+            words = [f"word{rng.randint(0, 9999)}" for _ in range(12)]
+            f.write(",".join([
+                f"Drug{i}", f'"Brand{i}"', f"Class{i % 40}", "Tablet",
+                f'"{" ".join(words[:4])}"', f'"{" ".join(words[4:8])}"', " ".join(words[8:])
+            ]) + "\n")
+
+
+def legacy_read_catalog(file_path):
+    """Previous DataManager.load_data parsing path, kept here for comparison"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        lines = f.readlines()
+
+    section_name = None
+    sections = {}
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("#"):
+            section_name = line[1:].strip()
+            sections[section_name] = []
+        elif section_name:
+            if not line.lower().startswith("generic name"):
+                sections[section_name].append(line)
+
+    all_rows = []
+    for section, rows in sections.items():
+        for row in rows:
+            all_rows.append((section, row))
+
+    df = pd.DataFrame([r[1].split(",") for r in all_rows], columns=CATALOG_COLUMNS)
+    df['Section'] = [r[0] for r in all_rows]
+    return df
+
+
+def streaming_read_catalog(file_path):
+    """Current parsing path: streaming parser, then a DataFrame"""
+    return load_catalog(file_path, use_cache=False).to_dataframe()
+
+
+def measure(func, path, repeat):
+    """Return (best seconds, peak traced bytes, rows)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        df = func(path)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    func(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, len(df)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "catalog.csv")
+        write_synthetic_catalog(path, args.rows)
+        size_mb = os.path.getsize(path) / 1e6
+        print(f"Synthetic catalog: {args.rows} rows, {size_mb:.1f} MB")
+
+        for name, func in [("legacy", legacy_read_catalog), ("streaming", streaming_read_catalog)]:
+            seconds, peak, rows = measure(func, path, args.repeat)
+            print(f"{name:>10}: {seconds * 1000:8.1f} ms  {rows / seconds:>10,.0f} rows/s  "
+                  f"peak {peak / 1e6:6.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# bench_core_import.py - Import time of the headless core, checked against a budget
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules the core must never pull in at import time
+FORBIDDEN_MODULES = ("tkinter", "pandas", "numpy")
+
+IMPORT_BUDGET_MS = 30.0
+
+PROBE = f"""
+import sys, time
+start = time.perf_counter()
+import study_core
+elapsed = (time.perf_counter() - start) * 1000
+loaded = [name for name in {FORBIDDEN_MODULES!r} if name in sys.modules]
+print(elapsed, ",".join(loaded))
+"""
+
+
+def measure_once():
+    """Import study_core in a fresh interpreter; return (ms, forbidden modules loaded)"""
+    output = subprocess.run([sys.executable, "-c", PROBE], cwd=ROOT, check=True,
+                            capture_output=True, text=True).stdout.split()
+    return float(output[0]), output[1:]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    args = parser.parse_args()
+
+    timings = []
+    for _ in range(args.repeat):
+        elapsed, loaded = measure_once()
+        if loaded:
+            print(f"FAIL: importing study_core loaded {', '.join(loaded)}")
+            return 1
+        timings.append(elapsed)
+
+    best = min(timings)
+    print(f"import study_core: best {best:.2f} ms, worst {max(timings):.2f} ms "
+          f"(budget {args.budget_ms:.0f} ms)")
+    if best > args.budget_ms:
+        print("FAIL: import time over budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+# bench_flashcards.py - Per-card latency and widget creations: rebuild-per-card vs cached screen
+# Needs a display (run under xvfb-run on headless machines).
+import argparse
+import os
+import sys
+import time
+import tkinter as tk
+from tkinter import ttk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from learn_mode import LearnMode
+from screen_manager import ScreenManager
+from study_core import load_catalog
+from ui_components import UIComponents
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class WidgetCounter:
+    """Counts every Tk widget constructed while active"""
+
+    def __init__(self):
+        self.count = 0
+        self.original = tk.BaseWidget.__init__
+
+    def __enter__(self):
+        counter = self
+        original = self.original
+
+        def counting_init(widget, *args, **kwargs):
+            counter.count += 1
+            original(widget, *args, **kwargs)
+
+        tk.BaseWidget.__init__ = counting_init
+        return self
+
+    def __exit__(self, *exc):
+        tk.BaseWidget.__init__ = self.original
+
+
+class BenchApp:
+    """Just enough of DrugStudyApp for LearnMode"""
+
+    def __init__(self, root):
+        self.root = root
+        self.ui_components = UIComponents(root)
+        self.screens = ScreenManager(root)
+
+    def show_screen(self, name, build, rebuild=False):
+        return self.screens.show(name, build, rebuild)
+
+    def create_main_menu(self):
+        pass
+
+
+def legacy_show_flashcard(root, card, index, total):
+    """Previous LearnMode.show_flashcard: destroy the window contents and rebuild every widget"""
+    for widget in root.winfo_children():
+        widget.destroy()
+
+    main_frame = ttk.Frame(root, padding="25")
+    main_frame.pack(fill="both", expand=True)
+    ttk.Label(main_frame, text="📚 Learn Mode", style="Title.TLabel").pack()
+    ttk.Label(main_frame, text=f"Card {index + 1} of {total}", font=('Arial', 12)).pack(pady=(5, 20))
+
+    card_frame = ttk.LabelFrame(main_frame, text=f"💊 {card.get('Generic Name')}", padding="25")
+    card_frame.pack(fill="both", expand=True, pady=(0, 20))
+    text_widget = tk.Text(card_frame, wrap=tk.WORD, font=('Arial', 12), height=18,
+                          bg='white', relief='flat', padx=20, pady=20)
+    scrollbar = ttk.Scrollbar(card_frame, orient="vertical", command=text_widget.yview)
+    text_widget.configure(yscrollcommand=scrollbar.set)
+    text_widget.pack(side="left", fill="both", expand=True)
+    scrollbar.pack(side="right", fill="y")
+    for column, content in card.items():
+        text_widget.insert(tk.END, f"{column}\n", "header")
+        text_widget.insert(tk.END, f"{content}\n\n", "content")
+    text_widget.config(state=tk.DISABLED)
+
+    nav_frame = ttk.Frame(main_frame)
+    nav_frame.pack(fill="x")
+    for text in ("← Previous", "🔀 Shuffle", "🏠 Menu", "Next →"):
+        ttk.Button(nav_frame, text=text, style="Primary.TButton").pack(side="left")
+
+
+def run(cards, step):
+    """Show every card once, flushing layout each time; return (ms per card, widgets created)"""
+    root = tk.Tk()
+    root.geometry("1400x900")
+    UIComponents(root).setup_styles()
+    with WidgetCounter() as counter:
+        start = time.perf_counter()
+        for index in range(len(cards)):
+            step(root, index)
+            root.update_idletasks()
+        elapsed = time.perf_counter() - start
+    root.destroy()
+    return elapsed * 1000 / len(cards), counter.count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cards", type=int, default=1000)
+    args = parser.parse_args()
+
+    catalog = load_catalog(os.path.join(ROOT, "drugs.csv"))
+    records = [catalog.record(idx) for idx in range(len(catalog))]
+    cards = [records[i % len(records)] for i in range(args.cards)]
+
+    def legacy_step(root, index):
+        legacy_show_flashcard(root, cards[index], index, len(cards))
+
+    learn_mode = {}
+
+    def cached_step(root, index):
+        if index == 0:
+            learn_mode['mode'] = LearnMode(BenchApp(root))
+            learn_mode['mode'].current_cards = cards
+        learn_mode['mode'].current_card_index = index
+        learn_mode['mode'].show_flashcard()
+
+    for name, step in [("rebuild", legacy_step), ("cached", cached_step)]:
+        per_card, widgets = run(cards, step)
+        print(f"{name:>8}: {per_card:7.3f} ms/card  {widgets:6d} widgets created for {len(cards)} cards")
+
+
+if __name__ == "__main__":
+    main()
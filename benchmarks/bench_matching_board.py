@@ -0,0 +1,75 @@
+# bench_matching_board.py - Matching board setup and highlight cost: ttk buttons vs a single canvas
+# Needs a display (run under xvfb-run on headless machines).
+import argparse
+import os
+import sys
+import time
+import tkinter as tk
+from tkinter import ttk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from board_views import ButtonBoard, CanvasBoard
+from study_core import BoardGenerator, load_catalog
+from ui_components import UIComponents
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEXT_LENGTH = 50
+
+
+def board_cards(catalog, num_cards):
+    """Two columns of (pair ID, value) cards, repeating the catalog if it is too small"""
+    rows = BoardGenerator(catalog, TEXT_LENGTH).draw(range(len(catalog)), 'Generic Name', 'Drug Class', num_cards)
+    rows = (rows * (num_cards // (2 * len(rows)) + 1))[:num_cards // 2]
+    generic = catalog.columns['Generic Name']
+    drug_class = catalog.columns['Drug Class']
+    return ([(pair_id, generic[idx]) for pair_id, idx in enumerate(rows)],
+            [(pair_id, drug_class[idx]) for pair_id, idx in enumerate(rows)])
+
+
+def measure(root, ui_components, board_class, columns, repeat):
+    """Return (best setup seconds, mean seconds per highlight) for one renderer"""
+    best = float('inf')
+    for _ in range(repeat):
+        frame = ttk.Frame(root)
+        frame.pack(fill="both", expand=True)
+        start = time.perf_counter()
+        board = board_class(frame, ui_components, lambda card: None)
+        card_pairs = board.build(columns, ("Generic Name", "Drug Class"), TEXT_LENGTH)
+        root.update_idletasks()
+        best = min(best, time.perf_counter() - start)
+
+        cards = list(card_pairs)
+        start = time.perf_counter()
+        for state in ('selected', 'error', 'normal', 'matched'):
+            for card in cards:
+                board.paint(card, state)
+        root.update_idletasks()
+        paint_seconds = (time.perf_counter() - start) / (4 * len(cards))
+        frame.destroy()
+    return best, paint_seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cards", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    catalog = load_catalog(os.path.join(ROOT, "drugs.csv"))
+    columns = board_cards(catalog, args.cards)
+
+    root = tk.Tk()
+    root.geometry("1400x900")
+    ui_components = UIComponents(root)
+    ui_components.setup_styles()
+
+    print(f"{args.cards} cards")
+    for name, board_class in [("buttons", ButtonBoard), ("canvas", CanvasBoard)]:
+        setup, paint = measure(root, ui_components, board_class, columns, args.repeat)
+        print(f"{name:>8}: setup {setup * 1000:7.1f} ms  highlight {paint * 1e6:7.1f} us/card")
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
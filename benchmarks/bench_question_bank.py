@@ -0,0 +1,87 @@
+# bench_question_bank.py - Full question bank: legacy iterrows loop vs list loop vs vectorized builder
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from study_core import Catalog, QUESTION_TYPES, build_question_bank, generate_questions
+
+
+def synthetic_catalog(num_rows, missing_rate=0.05, rows_per_section=50):
+    """Build a catalog in memory; a few values are left empty so masks matter"""
+    rng = random.Random(42)
+    columns = {
+        'Generic Name': [f"drug{i}" for i in range(num_rows)],
+        'Brand Name(s)': [f"Brand{i}" for i in range(num_rows)],
+        'Drug Class': [f"Class{i % 40}" for i in range(num_rows)],
+        'Dosage Form': ["Tablet"] * num_rows,
+        'Indication': [f"condition{rng.randint(0, 999)}" for _ in range(num_rows)],
+        'Side Effects': [f"effect{rng.randint(0, 999)}" for _ in range(num_rows)],
+        'Notes': [""] * num_rows,
+    }
+    for name in ('Brand Name(s)', 'Indication', 'Side Effects'):
+        values = columns[name]
+        for i in range(num_rows):
+            if rng.random() < missing_rate:
+                values[i] = ""
+    columns['Section'] = [f"SECTION {i // rows_per_section}" for i in range(num_rows)]
+    section_ranges = [[f"SECTION {s}", start, min(start + rows_per_section, num_rows)]
+                      for s, start in enumerate(range(0, num_rows, rows_per_section))]
+    return Catalog(columns, section_ranges)
+
+
+def legacy_generate_questions(data):
+    """Original QAPractice.generate_questions loop (iterrows + pd.notna), kept for comparison"""
+    questions = []
+    for _, row in data.iterrows():
+        for q_col, a_col, q_template in QUESTION_TYPES:
+            if pd.notna(row[q_col]) and pd.notna(row[a_col]):
+                questions.append({
+                    'question': q_template.format(row[q_col]),
+                    'correct_answer': str(row[a_col]),
+                    'drug_index': row.name,
+                    'type': f"{q_col}_to_{a_col}"
+                })
+    random.shuffle(questions)
+    return questions
+
+
+def timed(func, repeat):
+    """Return (best seconds, result of the last run)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    catalog = synthetic_catalog(args.rows)
+    # The legacy path saw missing values as NaN
+    df = catalog.to_dataframe().replace("", float('nan'))
+    indices = range(len(catalog))
+
+    legacy_seconds, legacy = timed(lambda: legacy_generate_questions(df), 1)
+    loop_seconds, loop = timed(lambda: generate_questions(catalog, indices), args.repeat)
+    bank_seconds, bank = timed(lambda: build_question_bank(catalog), args.repeat)
+
+    assert len(legacy) == len(loop) == len(bank), (len(legacy), len(loop), len(bank))
+    print(f"{args.rows} drugs -> {len(bank)} questions")
+    for name, seconds in [("iterrows", legacy_seconds), ("list loop", loop_seconds),
+                          ("vectorized", bank_seconds)]:
+        print(f"{name:>10}: {seconds * 1000:9.1f} ms  {legacy_seconds / seconds:7.1f}x vs iterrows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# bench_startup.py - Cold (CSV parse) vs warm (compiled snapshot) catalog startup time
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_manager import DataManager
+from study_core.cache import cache_path_for
+from bench_catalog_load import write_synthetic_catalog
+
+
+def timed_load(path):
+    """Load the catalog the way the app's background load does and return elapsed seconds"""
+    start = time.perf_counter()
+    DataManager(path).read_catalog()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=0,
+                        help="use a synthetic catalog of this many rows instead of drugs.csv")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "drugs.csv")
+        if args.rows:
+            write_synthetic_catalog(path, args.rows)
+        else:
+            root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            shutil.copy(os.path.join(root, "drugs.csv"), path)
+
+        cold, warm = [], []
+        for _ in range(args.repeat):
+            if os.path.exists(cache_path_for(path)):
+                os.remove(cache_path_for(path))
+            cold.append(timed_load(path))
+            warm.append(timed_load(path))
+
+        print(f"Catalog: {os.path.getsize(path) / 1e3:.0f} KB")
+        print(f"cold (parse + write snapshot): {min(cold) * 1000:8.2f} ms")
+        print(f"warm (snapshot):               {min(warm) * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# bench_weak_sampling.py - Weighted card draws: per-draw random.choices vs a prebuilt alias table
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from study_core import AliasTable, weakness_weights
+
+
+def synthetic_performance(num_drugs, rng):
+    """drug_performance for num_drugs drugs; about a fifth were never answered"""
+    performance = {}
+    for i in range(num_drugs):
+        if rng.random() < 0.8:
+            total = rng.randint(1, 40)
+            performance[f"drug{i}"] = {'correct': rng.randint(0, total), 'total': total}
+    return performance
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--drugs", type=int, default=100000)
+    parser.add_argument("--draws", type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = random.Random(3)
+    drug_ids = [f"drug{i}" for i in range(args.drugs)]
+    performance = synthetic_performance(args.drugs, rng)
+
+    start = time.perf_counter()
+    weights = weakness_weights(drug_ids, performance)
+    weight_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(args.draws):
+        # What a naive sampler does: weights handed over (and summed) on every draw
+        rng.choices(range(args.drugs), weights)
+    naive_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    table = AliasTable(weights)
+    build_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    counts = [0] * args.drugs
+    for _ in range(args.draws * 100):
+        counts[table.sample(rng)] += 1
+    alias_seconds = (time.perf_counter() - start) / 100
+
+    # Share of draws landing on the weakest tenth of drugs vs its share of the weight
+    weakest = sorted(range(args.drugs), key=weights.__getitem__)[-args.drugs // 10:]
+    expected = sum(weights[i] for i in weakest) / sum(weights)
+    observed = sum(counts[i] for i in weakest) / (args.draws * 100)
+
+    print(f"{args.drugs} drugs, {args.draws} draws")
+    print(f"weights: {weight_seconds * 1000:8.1f} ms  alias build: {build_seconds * 1000:8.1f} ms")
+    print(f"  choices: {naive_seconds * 1e6 / args.draws:8.1f} us/draw")
+    print(f"    alias: {alias_seconds * 1e6 / args.draws:8.2f} us/draw")
+    print(f"weakest 10%: expected {expected:.3%} of draws, observed {observed:.3%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# board_views.py - Matching-game board renderers: one ttk.Button per card, or one canvas
+import tkinter as tk
+from tkinter import ttk
+
+# Card state -> ttk style (see UIComponents.setup_styles)
+BUTTON_STYLES = {
+    'normal': "TButton",
+    'selected': "Selected.TButton",
+    'matched': "Matched.TButton",
+    'error': "Error.TButton",
+}
+
+# Card state -> (fill, outline, text colour) for the canvas board, matching the button styles
+CANVAS_COLORS = {
+    'normal': ("white", "#adb5bd", "black"),
+    'selected': ("#dbe7ff", "blue", "blue"),
+    'matched': ("lightgreen", "green", "green"),
+    'error': ("lightcoral", "red", "red"),
+}
+
+
+class ButtonBoard:
+    """One ttk.Button per card in a scrollable grid"""
+
+    def __init__(self, parent, ui_components, on_select):
+        self.parent = parent
+        self.ui_components = ui_components
+        self.on_select = on_select
+
+    def build(self, columns, headers, text_length):
+        """Lay out two columns of (pair ID, value) cards; returns {card: pair ID}"""
+        board_frame = ttk.LabelFrame(self.ui_components.create_scrollable_frame(self.parent),
+                                     text="Game Board", padding="20")
+        board_frame.pack()
+
+        card_pairs = {}
+        for column, (header, cards) in enumerate(zip(headers, columns)):
+            ttk.Label(board_frame, text=header, style="Subtitle.TLabel").grid(row=0, column=column, pady=(0, 10))
+            for i, (pair_id, item) in enumerate(cards):
+                btn = ttk.Button(board_frame, text=str(item)[:text_length], width=45)
+                btn.config(command=lambda b=btn: self.on_select(b))
+                btn.grid(row=i+1, column=column, padx=10, pady=5, sticky="ew")
+                card_pairs[btn] = pair_id
+        return card_pairs
+
+    def paint(self, card, state):
+        card.config(style=BUTTON_STYLES[state], state="disabled" if state == 'matched' else "normal")
+
+    def exists(self, card):
+        return card.winfo_exists()
+
+
+class CanvasBoard:
+    """Every card is a rectangle plus a text item on a single tk.Canvas
+
+    Both items carry the "card" tag, which has the only click binding; the
+    item under the pointer ("current") is mapped back to its card's
+    rectangle in a dict. Changing a card's state reconfigures its two items,
+    so no widget is created or restyled after setup.
+    """
+
+    CARD_WIDTH = 340
+    CARD_HEIGHT = 30
+    ROW_GAP = 6
+    COLUMN_GAP = 30
+    MARGIN = 10
+    HEADER_HEIGHT = 34
+
+    def __init__(self, parent, ui_components, on_select):
+        self.parent = parent
+        self.ui_components = ui_components
+        self.on_select = on_select
+        self.canvas = None
+        # Rectangle or text item -> the card's rectangle; rectangle -> its text item
+        self.item_cards = {}
+        self.card_texts = {}
+
+    def build(self, columns, headers, text_length):
+        """Draw two columns of (pair ID, value) cards; returns {card rectangle: pair ID}"""
+        canvas = tk.Canvas(self.parent, bg="white", highlightthickness=0)
+        scrollbar = ttk.Scrollbar(self.parent, orient="vertical", command=canvas.yview)
+        canvas.configure(yscrollcommand=scrollbar.set)
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        self.canvas = canvas
+
+        fill, outline, text_color = CANVAS_COLORS['normal']
+        card_pairs = {}
+        for column, (header, cards) in enumerate(zip(headers, columns)):
+            x = self.MARGIN + column * (self.CARD_WIDTH + self.COLUMN_GAP)
+            canvas.create_text(x + self.CARD_WIDTH / 2, self.MARGIN + self.HEADER_HEIGHT / 2, text=header,
+                               font=('Arial', 14, 'bold'))
+            y = self.MARGIN + self.HEADER_HEIGHT
+            for pair_id, item in cards:
+                rect = canvas.create_rectangle(x, y, x + self.CARD_WIDTH, y + self.CARD_HEIGHT,
+                                               fill=fill, outline=outline, tags="card")
+                text = canvas.create_text(x + 8, y + self.CARD_HEIGHT / 2, anchor="w", fill=text_color,
+                                          text=str(item)[:text_length], font=('Arial', 10), tags="card")
+                self.item_cards[rect] = self.item_cards[text] = rect
+                self.card_texts[rect] = text
+                card_pairs[rect] = pair_id
+                y += self.CARD_HEIGHT + self.ROW_GAP
+
+        canvas.tag_bind("card", "<Button-1>", self.click)
+        canvas.configure(scrollregion=canvas.bbox("all"))
+        self.ui_components.bind_mousewheel(canvas)
+        return card_pairs
+
+    def click(self, event):
+        """Hit-test: the item under the pointer is tagged "current" """
+        items = self.canvas.find_withtag("current")
+        if items:
+            self.on_select(self.item_cards[items[0]])
+
+    def paint(self, card, state):
+        fill, outline, text_color = CANVAS_COLORS[state]
+        self.canvas.itemconfigure(card, fill=fill, outline=outline)
+        self.canvas.itemconfigure(self.card_texts[card], fill=text_color)
+
+    def exists(self, card):
+        return self.canvas is not None and self.canvas.winfo_exists() and card in self.card_texts
@@ -1,58 +1,137 @@
-
 # drug_study_app.py - Main application class
-import os
-import pandas as pd
+import importlib
 import tkinter as tk
 from tkinter import messagebox, ttk
-import random
-import json
-from datetime import datetime
 
 from data_manager import DataManager
-from progress_manager import ProgressManager
+from screen_manager import ScreenManager
+from startup_profiler import StartupProfiler
+from study_core import ProgressManager, list_profiles, profile_slug
+from task_scheduler import TaskScheduler
 from ui_components import UIComponents
-from matching_game import MatchingGame
-from qa_practice import QAPractice
-from learn_mode import LearnMode
-from progress_tracker import ProgressTracker
-from drug_selector import DrugSelector
+
+# Mode attribute -> (module, class); each module is imported on first use
+MODE_CLASSES = {
+    'matching_game': ('matching_game', 'MatchingGame'),
+    'qa_practice': ('qa_practice', 'QAPractice'),
+    'learn_mode': ('learn_mode', 'LearnMode'),
+    'progress_tracker': ('progress_tracker', 'ProgressTracker'),
+    'drug_selector': ('drug_selector', 'DrugSelector'),
+}
+
+# Study order choices for Q&A and Learn Mode; weak-drug focus applies to flashcards only
+SHUFFLE_ORDER = "Shuffle"
+DUE_REVIEW_ORDER = "Due review"
+WEAK_FOCUS_ORDER = "Focus weak drugs (Learn only)"
+
 
 class DrugStudyApp:
     """Main Drug Study Application Class"""
     
-    def __init__(self):
-        self.root = tk.Tk()
-        self.root.title("Drug Study Platform")
-        self.root.geometry("1400x900")
+    def __init__(self, profiler=None, profile="default"):
+        self.profiler = profiler or StartupProfiler()
+        
+        with self.profiler.step("create root window"):
+            self.root = tk.Tk()
+            self.root.title("Drug Study Platform")
+            self.root.geometry("1400x900")
+            self.root.protocol("WM_DELETE_WINDOW", self.close)
         
         # Initialize managers
+        self.scheduler = TaskScheduler(self.root)
         self.data_manager = DataManager()
-        self.progress_manager = ProgressManager()
+        self.progress_manager = ProgressManager(profile)
         self.ui_components = UIComponents(self.root)
+        self.screens = ScreenManager(self.root)
+        self.progress_labels = []
+        self.profile_var = None
+        self.profile_combo = None
+        self.study_order_var = None
+        self.modes = {}
         
-        # Initialize game modes
-        self.matching_game = MatchingGame(self)
-        self.qa_practice = QAPractice(self)
-        self.learn_mode = LearnMode(self)
-        self.progress_tracker = ProgressTracker(self)
-        self.drug_selector = DrugSelector(self)
+        # Load progress and show the menu; the catalog loads in the background
+        with self.profiler.step("load progress"):
+            self.progress_manager.load_progress()
+        with self.profiler.step("build main menu"):
+            self.ui_components.setup_styles()
+            self.create_main_menu()
+        self.root.after_idle(lambda: self.profiler.mark("first paint"))
         
-        # Load data and setup
-        self.data_manager.load_data()
-        self.progress_manager.load_progress()
-        self.ui_components.setup_styles()
-        self.create_main_menu()
+        self.catalog_ready = False
+        self.pending_mode = None
+        self.catalog_task = None
+        self.start_catalog_load()
     
-    def clear_window(self):
-        """Clear all widgets from the window"""
-        for widget in self.root.winfo_children():
-            widget.destroy()
+    def __getattr__(self, name):
+        """Create game modes lazily the first time they are used"""
+        if name not in MODE_CLASSES or 'modes' not in self.__dict__:
+            raise AttributeError(name)
+        
+        if name not in self.modes:
+            module_name, class_name = MODE_CLASSES[name]
+            with self.profiler.step(f"import {module_name}"):
+                module = importlib.import_module(module_name)
+            self.modes[name] = getattr(module, class_name)(self)
+        return self.modes[name]
+    
+    def start_catalog_load(self):
+        """Read the catalog in the background; the load can be cancelled from the busy indicator"""
+        self.catalog_task = self.scheduler.submit(
+            self.load_catalog_in_background,
+            on_done=lambda _: self.finish_catalog_load(),
+            on_error=lambda e: self.finish_catalog_load(e),
+            on_cancel=self.cancel_catalog_load,
+            description="Loading drug catalog...",
+            cancellable=True)
+    
+    def load_catalog_in_background(self, cancel_event):
+        """Read the catalog on a worker thread (no Tk calls allowed here)"""
+        with self.profiler.step("load catalog"):
+            self.data_manager.read_catalog(cancel_event)
+    
+    def cancel_catalog_load(self):
+        """Forget a cancelled load and any mode waiting on it; the next mode click loads again"""
+        self.catalog_task = None
+        self.pending_mode = None
+    
+    def finish_catalog_load(self, error=None):
+        """Report load errors, migrate progress and open any mode clicked while loading"""
+        self.catalog_ready = True
+        
+        if error is not None:
+            self.data_manager.show_load_error(error)
+        else:
+            self.progress_manager.migrate_drug_ids(self.data_manager.catalog)
+        self.profiler.report()
+        
+        if self.pending_mode is not None:
+            mode_name, method_name = self.pending_mode
+            self.pending_mode = None
+            self.open_mode(mode_name, method_name)
+    
+    def open_mode(self, mode_name, method_name):
+        """Open a study mode, deferring it until the catalog has loaded"""
+        if not self.catalog_ready:
+            self.pending_mode = (mode_name, method_name)
+            if self.catalog_task is None:
+                self.start_catalog_load()
+            return
+        getattr(getattr(self, mode_name), method_name)()
+    
+    def show_screen(self, name, build, rebuild=False):
+        """Raise a cached screen, building it first if needed"""
+        return self.screens.show(name, build, rebuild)
     
     def create_main_menu(self):
+        """Show the main menu with fresh progress numbers"""
+        self.show_screen('main_menu', self.build_main_menu)
+        self.ui_components.update_progress_overview(self.progress_labels, self.progress_manager.progress)
+        self.profile_var.set(self.progress_manager.profile)
+        self.profile_combo.config(values=list_profiles())
+    
+    def build_main_menu(self, screen):
         """Create the main menu interface"""
-        self.clear_window()
-        
-        main_frame = ttk.Frame(self.root, padding="30")
+        main_frame = ttk.Frame(screen, padding="30")
         main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # Title
@@ -60,27 +139,76 @@ class DrugStudyApp:
         title_label.grid(row=0, column=0, columnspan=3, pady=(0, 30))
         
         # Progress overview
-        self.ui_components.create_progress_overview(main_frame, self.progress_manager.progress)
+        self.progress_labels = self.ui_components.create_progress_overview(
+            main_frame, self.progress_manager.progress)
         
         # Study mode buttons
         button_data = [
-            ("🎯 Matching Game", "Match drug names with information", self.matching_game.open_matching_game),
-            ("❓ Q&A Practice", "Test knowledge with questions", self.qa_practice.open_qa_practice),
-            ("📚 Learn Mode", "Study with flashcards", self.learn_mode.open_learn_mode),
-            ("⚙️ Drug Selection", "Choose drugs to study", self.drug_selector.open_drug_selection),
-            ("📈 Progress Tracker", "View study statistics", self.progress_tracker.open_progress_tracker),
-            ("🚪 Exit", "Close application", self.root.quit)
+            ("🎯 Matching Game", "Match drug names with information",
+             lambda: self.open_mode('matching_game', 'open_matching_game')),
+            ("❓ Q&A Practice", "Test knowledge with questions",
+             lambda: self.open_mode('qa_practice', 'open_qa_practice')),
+            ("📚 Learn Mode", "Study with flashcards",
+             lambda: self.open_mode('learn_mode', 'open_learn_mode')),
+            ("⚙️ Drug Selection", "Choose drugs to study",
+             lambda: self.open_mode('drug_selector', 'open_drug_selection')),
+            ("📈 Progress Tracker", "View study statistics",
+             lambda: self.open_mode('progress_tracker', 'open_progress_tracker')),
+            ("🚪 Exit", "Close application", self.close)
         ]
         
         self.ui_components.create_menu_buttons(main_frame, button_data)
         
+        # Profile picker: choose an existing profile or type a new name
+        profile_frame = ttk.Frame(main_frame)
+        profile_frame.grid(row=3, column=0, columnspan=3, pady=(10, 0))
+        ttk.Label(profile_frame, text="👤 Profile:", font=('Arial', 10, 'bold')).pack(side="left", padx=(0, 5))
+        self.profile_var = tk.StringVar(value=self.progress_manager.profile)
+        self.profile_combo = ttk.Combobox(profile_frame, textvariable=self.profile_var,
+                                          values=list_profiles(), width=20)
+        self.profile_combo.pack(side="left")
+        self.profile_combo.bind("<<ComboboxSelected>>", lambda e: self.switch_profile())
+        self.profile_combo.bind("<Return>", lambda e: self.switch_profile())
+        
+        # Study order: shuffle everything, only what spaced repetition says is due, or (in Learn Mode)
+        # weak drugs more often
+        ttk.Label(profile_frame, text="🔁 Study order:", font=('Arial', 10, 'bold')).pack(side="left", padx=(20, 5))
+        self.study_order_var = tk.StringVar(value=SHUFFLE_ORDER)
+        ttk.Combobox(profile_frame, textvariable=self.study_order_var, state="readonly",
+                     values=[SHUFFLE_ORDER, DUE_REVIEW_ORDER, WEAK_FOCUS_ORDER], width=28).pack(side="left")
+        
         # Configure grid weights
-        self.root.grid_rowconfigure(0, weight=1)
-        self.root.grid_columnconfigure(0, weight=1)
+        screen.grid_rowconfigure(0, weight=1)
+        screen.grid_columnconfigure(0, weight=1)
+    
+    def switch_profile(self):
+        """Load the progress of the profile named in the picker"""
+        name = self.profile_var.get()
+        if not name.strip() or profile_slug(name) == self.progress_manager.profile:
+            return
+        
+        self.progress_manager.switch_profile(name)
+        if self.catalog_ready:
+            self.progress_manager.migrate_drug_ids(self.data_manager.catalog)
+        self.create_main_menu()
+    
+    def due_review_selected(self):
+        """True if study modes should show only items due for review"""
+        return self.study_order_var is not None and self.study_order_var.get() == DUE_REVIEW_ORDER
+    
+    def weak_focus_selected(self):
+        """True if flashcards should favour drugs with a high error rate (Q&A shuffles instead)"""
+        return self.study_order_var is not None and self.study_order_var.get() == WEAK_FOCUS_ORDER
+    
+    def get_selected_indices(self):
+        """Get row positions of currently selected drugs"""
+        return self.data_manager.get_selected_indices()
     
-    def get_selected_data(self):
-        """Get currently selected drugs"""
-        return self.data_manager.get_selected_data()
+    def close(self):
+        """Finish background work, flush unsaved progress and close the window"""
+        self.scheduler.shutdown()
+        self.progress_manager.close()
+        self.root.destroy()
     
     def run(self):
         """Start the application"""
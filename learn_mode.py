@@ -5,6 +5,8 @@ import tkinter as tk
 from tkinter import messagebox, ttk
 import random
 
+from study_core import FLASHCARD_QTYPE, AliasTable, SampledDeck, review_cards, weakness_weights
+
 class LearnMode:
     """Handles the learn mode (flashcards) functionality"""
     
@@ -12,52 +14,126 @@ class LearnMode:
         self.app = app
         self.current_cards = []
         self.current_card_index = 0
+        # Due review: cards are self-graded and rescheduled
+        self.reviewing = False
+        # Focus weak drugs: alias table over the selection, rebuilt when it or the scores change
+        self.weak_table = None
+        self.weak_table_key = None
+        # Widgets of the cached flashcard screen
+        self.progress_label = None
+        self.card_frame = None
+        self.text_widget = None
+        self.previous_button = None
+        self.grade_frame = None
     
     def open_learn_mode(self):
         """Open flashcard learning mode"""
-        selected_data = self.app.get_selected_data()
-        if selected_data.empty:
+        indices = self.app.get_selected_indices()
+        if not indices:
             return
         
-        self.current_cards = selected_data.to_dict('records')
+        catalog = self.app.data_manager.catalog
+        self.reviewing = self.app.due_review_selected()
+        if self.reviewing:
+            indices = review_cards(catalog, indices, self.app.progress_manager.progress['reviews'])
+            if not indices:
+                messagebox.showinfo("🎉 All Caught Up", "No flashcards are due for review right now.")
+                return
+        
+        if not self.reviewing and self.app.weak_focus_selected():
+            self.current_cards = self.weighted_deck(catalog, indices)
+        else:
+            self.current_cards = [self.make_card(catalog, idx) for idx in indices]
+            if not self.reviewing:
+                random.shuffle(self.current_cards)
         self.current_card_index = 0
-        random.shuffle(self.current_cards)
         
         self.show_flashcard()
     
-    def show_flashcard(self):
-        """Show current flashcard"""
-        if self.current_card_index >= len(self.current_cards):
-            messagebox.showinfo("📚 Complete!", "You've reviewed all selected drugs! Great job!")
-            self.app.create_main_menu()
-            return
-        
-        self.app.clear_window()
-        card = self.current_cards[self.current_card_index]
-        
-        main_frame = ttk.Frame(self.app.root, padding="25")
+    def make_card(self, catalog, idx):
+        """One drug's flashcard fields plus its ID"""
+        return dict(catalog.record(idx), drug_id=catalog.ids[idx])
+    
+    def weighted_deck(self, catalog, indices):
+        """Deck of len(indices) cards drawn in proportion to each drug's error rate"""
+        selection = self.app.data_manager.selection
+        progress_manager = self.app.progress_manager
+        key = (selection, selection.version, progress_manager.performance_version)
+        if key != self.weak_table_key:
+            drug_ids = [catalog.ids[idx] for idx in indices]
+            self.weak_table = AliasTable(weakness_weights(drug_ids, progress_manager.progress['drug_performance']))
+            self.weak_table_key = key
+        return SampledDeck(self.weak_table, len(indices), lambda position: self.make_card(catalog, indices[position]))
+    
+    def build_flashcard_screen(self, screen):
+        """Create the flashcard widgets once; show_flashcard only updates them"""
+        main_frame = ttk.Frame(screen, padding="25")
         main_frame.pack(fill="both", expand=True)
         
         # Header
         ttk.Label(main_frame, text="📚 Learn Mode", style="Title.TLabel").pack()
         
-        progress_text = f"Card {self.current_card_index + 1} of {len(self.current_cards)}"
-        ttk.Label(main_frame, text=progress_text, font=('Arial', 12)).pack(pady=(5, 20))
+        self.progress_label = ttk.Label(main_frame, font=('Arial', 12))
+        self.progress_label.pack(pady=(5, 20))
         
         # Card content
-        card_frame = ttk.LabelFrame(main_frame, text=f"💊 {card.get('Generic Name', 'Drug Info')}", 
-                                   padding="25")
-        card_frame.pack(fill="both", expand=True, pady=(0, 20))
+        self.card_frame = ttk.LabelFrame(main_frame, padding="25")
+        self.card_frame.pack(fill="both", expand=True, pady=(0, 20))
         
         # Scrollable text
-        text_widget = tk.Text(card_frame, wrap=tk.WORD, font=('Arial', 12), height=18,
-                             bg='white', relief='flat', padx=20, pady=20)
-        scrollbar = ttk.Scrollbar(card_frame, orient="vertical", command=text_widget.yview)
-        text_widget.configure(yscrollcommand=scrollbar.set)
+        self.text_widget = tk.Text(self.card_frame, wrap=tk.WORD, font=('Arial', 12), height=18,
+                                   bg='white', relief='flat', padx=20, pady=20)
+        scrollbar = ttk.Scrollbar(self.card_frame, orient="vertical", command=self.text_widget.yview)
+        self.text_widget.configure(yscrollcommand=scrollbar.set)
         
-        text_widget.pack(side="left", fill="both", expand=True)
+        self.text_widget.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
+        self.text_widget.tag_configure("header", font=('Arial', 14, 'bold'), foreground='#2E86AB')
+        self.text_widget.tag_configure("content", font=('Arial', 12), lmargin1=20, lmargin2=20)
+        
+        # Navigation
+        nav_frame = ttk.Frame(main_frame)
+        nav_frame.pack(fill="x")
+        
+        self.previous_button = ttk.Button(nav_frame, text="← Previous", command=self.previous_flashcard,
+                                          style="Primary.TButton")
+        self.previous_button.pack(side="left")
+        
+        ttk.Button(nav_frame, text="🔀 Shuffle", command=self.shuffle_flashcards,
+                  style="Primary.TButton").pack(side="left", padx=(20, 0))
+        
+        # Self-grading, shown only during due review
+        self.grade_frame = ttk.Frame(nav_frame)
+        ttk.Button(self.grade_frame, text="❌ Again", command=lambda: self.grade_flashcard(False),
+                  style="Primary.TButton").pack(side="left", padx=(20, 0))
+        ttk.Button(self.grade_frame, text="✅ Got it", command=lambda: self.grade_flashcard(True),
+                  style="Primary.TButton").pack(side="left", padx=(5, 0))
+        
+        ttk.Button(nav_frame, text="🏠 Menu", command=self.app.create_main_menu,
+                  style="Primary.TButton").pack(side="right", padx=(0, 20))
+        
+        ttk.Button(nav_frame, text="Next →", command=self.next_flashcard,
+                  style="Primary.TButton").pack(side="right")
+    
+    def show_flashcard(self):
+        """Show current flashcard"""
+        if self.current_card_index >= len(self.current_cards):
+            messagebox.showinfo("📚 Complete!", "You've reviewed all selected drugs! Great job!")
+            self.app.create_main_menu()
+            return
+        
+        self.app.show_screen('learn_mode', self.build_flashcard_screen)
+        card = self.current_cards[self.current_card_index]
+        
+        self.progress_label.config(text=f"Card {self.current_card_index + 1} of {len(self.current_cards)}")
+        self.card_frame.config(text=f"💊 {card.get('Generic Name', 'Drug Info')}")
+        self.previous_button.config(state="normal" if self.current_card_index > 0 else "disabled")
+        if self.reviewing:
+            self.grade_frame.pack(side="left")
+        else:
+            self.grade_frame.pack_forget()
+        
         # Format drug information
         info_sections = [
             ("🏷️ Generic Name", card.get('Generic Name', 'N/A')),
@@ -69,37 +145,29 @@ class LearnMode:
             ("💡 Clinical Pearls", card.get('Clinical Pearls', 'N/A'))
         ]
         
+        text_widget = self.text_widget
+        text_widget.config(state=tk.NORMAL)
+        text_widget.delete("1.0", tk.END)
         for header, content in info_sections:
             if content and str(content) != 'N/A':
                 text_widget.insert(tk.END, f"{header}\n", "header")
                 text_widget.insert(tk.END, f"{content}\n\n", "content")
-        
-        text_widget.tag_configure("header", font=('Arial', 14, 'bold'), foreground='#2E86AB')
-        text_widget.tag_configure("content", font=('Arial', 12), lmargin1=20, lmargin2=20)
+        text_widget.yview_moveto(0)
         text_widget.config(state=tk.DISABLED)
-        
-        # Navigation
-        nav_frame = ttk.Frame(main_frame)
-        nav_frame.pack(fill="x")
-        
-        ttk.Button(nav_frame, text="← Previous", command=self.previous_flashcard,
-                  state="normal" if self.current_card_index > 0 else "disabled",
-                  style="Primary.TButton").pack(side="left")
-        
-        ttk.Button(nav_frame, text="🔀 Shuffle", command=self.shuffle_flashcards,
-                  style="Primary.TButton").pack(side="left", padx=(20, 0))
-        
-        ttk.Button(nav_frame, text="🏠 Menu", command=self.app.create_main_menu,
-                  style="Primary.TButton").pack(side="right", padx=(0, 20))
-        
-        ttk.Button(nav_frame, text="Next →", command=self.next_flashcard,
-                  style="Primary.TButton").pack(side="right")
     
     def next_flashcard(self):
         """Show next flashcard"""
         self.current_card_index += 1
         self.show_flashcard()
     
+    def grade_flashcard(self, remembered):
+        """Reschedule the current card; missed cards come back at the end of this session"""
+        card = self.current_cards[self.current_card_index]
+        self.app.progress_manager.record_review(card['drug_id'], FLASHCARD_QTYPE, 4 if remembered else 1)
+        if not remembered:
+            self.current_cards.append(card)
+        self.next_flashcard()
+    
     def previous_flashcard(self):
         """Show previous flashcard"""
         if self.current_card_index > 0:
@@ -107,8 +175,11 @@ class LearnMode:
             self.show_flashcard()
     
     def shuffle_flashcards(self):
-        """Shuffle and restart flashcards"""
-        random.shuffle(self.current_cards)
+        """Shuffle (or redraw a weighted deck) and restart flashcards"""
+        if isinstance(self.current_cards, SampledDeck):
+            self.current_cards.redraw()
+        else:
+            random.shuffle(self.current_cards)
         self.current_card_index = 0
         messagebox.showinfo("🔀 Shuffled", "Cards shuffled! Starting over.")
         self.show_flashcard()
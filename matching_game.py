@@ -4,26 +4,59 @@ import tkinter as tk
 from tkinter import messagebox, ttk
 import random
 
+from board_views import ButtonBoard, CanvasBoard
+from study_core import BoardGenerator
+
+DEFAULT_PAIRS = 8
+MAX_PAIRS = 500
+# Cards show this many characters of their value
+CARD_TEXT_LENGTH = 50
+# Board renderers; Auto switches to the canvas above CANVAS_AUTO_PAIRS pairs
+# (a starting point, not yet tuned with benchmarks/bench_matching_board.py)
+AUTO_RENDERER = "Auto"
+RENDERERS = {"Buttons": ButtonBoard, "Canvas": CanvasBoard}
+CANVAS_AUTO_PAIRS = 20
+
 class MatchingGame:
     """Handles the matching game functionality"""
     
     def __init__(self, app):
         self.app = app
         self.selected_cards = []
-        self.card_buttons = []
-        self.matches = []
+        # Card (button or canvas item) -> pair ID; the two cards of a pair share an ID
+        self.card_pairs = {}
+        # Card -> 'normal', 'selected', 'matched' or 'error'
+        self.card_states = {}
+        self.board = None
+        self.remaining_pairs = 0
+        self.error_cards = []
         self.category1 = None
         self.category2 = None
+        self.pair_count = None
+        self.renderer = None
+        self.capacity_label = None
+        self.capacity_tree = None
+        # Normalized column keys for the loaded catalog, reused across boards
+        self.boards = None
+        self.indices = []
     
     def open_matching_game(self):
         """Open matching game setup"""
-        selected_data = self.app.get_selected_data()
-        if selected_data.empty:
+        indices = self.app.get_selected_indices()
+        if not indices:
             return
         
-        self.app.clear_window()
-        
-        main_frame = ttk.Frame(self.app.root, padding="30")
+        self.indices = indices
+        catalog = self.app.data_manager.catalog
+        if self.boards is None or self.boards.catalog is not catalog:
+            self.boards = BoardGenerator(catalog, CARD_TEXT_LENGTH)
+        self.app.show_screen('matching_setup', self.build_setup_screen)
+        self.update_capacity()
+        self.load_capacities()
+    
+    def build_setup_screen(self, screen):
+        """Create the setup screen once"""
+        main_frame = ttk.Frame(screen, padding="30")
         main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         ttk.Label(main_frame, text="🎯 Matching Game Setup", style="Title.TLabel").grid(
@@ -38,25 +71,91 @@ class MatchingGame:
         
         ttk.Label(selection_frame, text="Category 1:", font=('Arial', 12, 'bold')).grid(
             row=0, column=0, padx=10, pady=5, sticky="w")
-        ttk.Combobox(selection_frame, textvariable=self.category1, 
-                    values=list(self.app.data_manager.df.columns), state="readonly", width=25).grid(
-            row=0, column=1, padx=10, pady=5)
+        columns = self.app.data_manager.catalog.column_names
+        combo1 = ttk.Combobox(selection_frame, textvariable=self.category1, 
+                              values=columns, state="readonly", width=25)
+        combo1.grid(row=0, column=1, padx=10, pady=5)
+        combo1.bind("<<ComboboxSelected>>", lambda e: self.update_capacity())
         
         ttk.Label(selection_frame, text="Category 2:", font=('Arial', 12, 'bold')).grid(
             row=0, column=2, padx=10, pady=5, sticky="w")
-        ttk.Combobox(selection_frame, textvariable=self.category2, 
-                    values=list(self.app.data_manager.df.columns), state="readonly", width=25).grid(
-            row=0, column=3, padx=10, pady=5)
+        combo2 = ttk.Combobox(selection_frame, textvariable=self.category2, 
+                              values=columns, state="readonly", width=25)
+        combo2.grid(row=0, column=3, padx=10, pady=5)
+        combo2.bind("<<ComboboxSelected>>", lambda e: self.update_capacity())
+        
+        ttk.Label(selection_frame, text="Pairs:", font=('Arial', 12, 'bold')).grid(
+            row=1, column=0, padx=10, pady=5, sticky="w")
+        self.pair_count = tk.IntVar(value=DEFAULT_PAIRS)
+        ttk.Spinbox(selection_frame, textvariable=self.pair_count, from_=2, to=MAX_PAIRS, width=8).grid(
+            row=1, column=1, padx=10, pady=5, sticky="w")
+        self.capacity_label = ttk.Label(selection_frame, font=('Arial', 10), foreground='gray')
+        self.capacity_label.grid(row=1, column=2, columnspan=2, padx=10, pady=5, sticky="w")
+        
+        ttk.Label(selection_frame, text="Board:", font=('Arial', 12, 'bold')).grid(
+            row=2, column=0, padx=10, pady=5, sticky="w")
+        self.renderer = tk.StringVar(value=AUTO_RENDERER)
+        ttk.Combobox(selection_frame, textvariable=self.renderer, values=[AUTO_RENDERER, *RENDERERS],
+                    state="readonly", width=10).grid(row=2, column=1, padx=10, pady=5, sticky="w")
+        
+        # Unique pairs for every category combination; picking a row selects both categories
+        combos_frame = ttk.LabelFrame(main_frame, text="Unique Pairs per Combination", padding="10")
+        combos_frame.grid(row=2, column=0, columnspan=4, sticky=(tk.W, tk.E))
+        columns = ("Category 1", "Category 2", "Unique pairs")
+        self.capacity_tree = ttk.Treeview(combos_frame, columns=columns, show="headings", height=6)
+        for col in columns:
+            self.capacity_tree.heading(col, text=col)
+            self.capacity_tree.column(col, width=180, anchor="center")
+        scrollbar = ttk.Scrollbar(combos_frame, orient="vertical", command=self.capacity_tree.yview)
+        self.capacity_tree.configure(yscrollcommand=scrollbar.set)
+        self.capacity_tree.pack(side="left", fill="x", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        self.capacity_tree.bind("<<TreeviewSelect>>", lambda e: self.pick_combination())
         
         # Buttons
         ttk.Button(main_frame, text="🎮 Start Game", 
-                  command=lambda: self.start_matching_game(selected_data), 
-                  style="Large.TButton").grid(row=2, column=0, columnspan=4, pady=20)
+                  command=lambda: self.start_matching_game(self.indices), 
+                  style="Large.TButton").grid(row=3, column=0, columnspan=4, pady=20)
         
         ttk.Button(main_frame, text="← Back", command=self.app.create_main_menu, 
-                  style="Primary.TButton").grid(row=3, column=0, columnspan=4)
+                  style="Primary.TButton").grid(row=4, column=0, columnspan=4)
     
-    def start_matching_game(self, data):
+    def update_capacity(self):
+        """Show how many look-alike-free pairs the chosen columns offer for the selection"""
+        cat1, cat2 = self.category1.get(), self.category2.get()
+        if not cat1 or not cat2 or cat1 == cat2:
+            self.capacity_label.config(text="")
+            return
+        capacity = self.boards.capacity(self.indices, cat1, cat2)
+        self.capacity_label.config(text=f"{capacity} unique pairs available")
+    
+    def load_capacities(self):
+        """Count unique pairs for every category combination in the background"""
+        self.capacity_tree.delete(*self.capacity_tree.get_children())
+        indices = self.indices
+        self.app.scheduler.submit(
+            self.boards.capacities, indices, self.app.data_manager.catalog.column_names,
+            on_done=lambda capacities: self.show_capacities(indices, capacities),
+            description="Counting unique pairs...")
+    
+    def show_capacities(self, indices, capacities):
+        """Fill the combination table, most pairs first (ignoring results for an older selection)"""
+        if indices is not self.indices or not self.capacity_tree.winfo_exists():
+            return
+        for (cat1, cat2), capacity in sorted(capacities.items(), key=lambda item: -item[1]):
+            self.capacity_tree.insert("", "end", values=(cat1, cat2, capacity))
+    
+    def pick_combination(self):
+        """Use the selected table row as the two categories"""
+        selected = self.capacity_tree.selection()
+        if not selected:
+            return
+        cat1, cat2, _ = self.capacity_tree.item(selected[0], "values")
+        self.category1.set(cat1)
+        self.category2.set(cat2)
+        self.update_capacity()
+    
+    def start_matching_game(self, indices):
         """Start the matching game"""
         cat1, cat2 = self.category1.get(), self.category2.get()
         
@@ -64,97 +163,105 @@ class MatchingGame:
             messagebox.showerror("Invalid Selection", "Please select two different categories.")
             return
         
-        self.app.clear_window()
+        try:
+            num_pairs = self.pair_count.get()
+        except tk.TclError:
+            num_pairs = 0
+        if not 2 <= num_pairs <= MAX_PAIRS:
+            messagebox.showerror("Invalid Selection", f"Please choose between 2 and {MAX_PAIRS} pairs.")
+            return
+        if self.boards.capacity(indices, cat1, cat2) < 2:
+            messagebox.showerror("Invalid Selection",
+                                 "These categories don't have two distinct pairs in the selected drugs.")
+            return
+        
+        self.app.show_screen('matching_board',
+                             lambda screen: self.build_board(screen, indices, cat1, cat2, num_pairs),
+                             rebuild=True)
+    
+    def build_board(self, screen, indices, cat1, cat2, num_pairs=DEFAULT_PAIRS):
+        """Create a fresh game board"""
         self.selected_cards = []
-        self.card_buttons = []
+        self.error_cards = []
+        self.card_pairs = {}
+        
+        game_frame = ttk.Frame(screen, padding="20")
+        game_frame.pack(fill="both", expand=True)
         
-        game_frame = ttk.Frame(self.app.root, padding="20")
-        game_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        # Prepare game data: no two cards on a side read the same; each card is
+        # (pair ID, value), the ID being its position in the sample
+        columns = self.app.data_manager.catalog.columns
+        sample = self.boards.draw(indices, cat1, cat2, num_pairs)
+        self.remaining_pairs = len(sample)
+        
+        cards1 = [(pair_id, columns[cat1][idx]) for pair_id, idx in enumerate(sample)]
+        cards2 = [(pair_id, columns[cat2][idx]) for pair_id, idx in enumerate(sample)]
+        random.shuffle(cards1)
+        random.shuffle(cards2)
         
         # Header
         header_frame = ttk.Frame(game_frame)
-        header_frame.grid(row=0, column=0, columnspan=2, pady=(0, 20))
+        header_frame.pack(pady=(0, 20))
         
         ttk.Label(header_frame, text="🎯 Matching Game", style="Title.TLabel").pack()
         ttk.Label(header_frame, text=f"Match {cat1} with {cat2}", 
                  font=('Arial', 14)).pack(pady=5)
-        
-        # Prepare game data
-        num_pairs = min(len(data), 8)
-        sample_data = data.sample(num_pairs) if len(data) >= num_pairs else data
-        
-        self.matches = list(zip(sample_data[cat1], sample_data[cat2]))
-        items1 = sample_data[cat1].tolist()
-        items2 = sample_data[cat2].tolist()
-        
-        random.shuffle(items1)
-        random.shuffle(items2)
-        
-        # Create game board
-        board_frame = ttk.LabelFrame(game_frame, text="Game Board", padding="20")
-        board_frame.grid(row=1, column=0, columnspan=2, pady=(0, 20))
-        
-        # Column headers
-        ttk.Label(board_frame, text=cat1, style="Subtitle.TLabel").grid(row=0, column=0, pady=(0, 10))
-        ttk.Label(board_frame, text=cat2, style="Subtitle.TLabel").grid(row=0, column=1, pady=(0, 10))
-        
-        # Create cards
-        for i, item in enumerate(items1):
-            btn = ttk.Button(board_frame, text=str(item)[:50], width=45)
-            btn.config(command=lambda b=btn: self.select_card(b))
-            btn.grid(row=i+1, column=0, padx=10, pady=5, sticky="ew")
-            self.card_buttons.append(btn)
-        
-        for i, item in enumerate(items2):
-            btn = ttk.Button(board_frame, text=str(item)[:50], width=45)
-            btn.config(command=lambda b=btn: self.select_card(b))
-            btn.grid(row=i+1, column=1, padx=10, pady=5, sticky="ew")
-            self.card_buttons.append(btn)
+        if len(sample) < num_pairs:
+            ttk.Label(header_frame, text=f"Only {len(sample)} pairs can be told apart in this selection",
+                     font=('Arial', 10), foreground='gray').pack()
         
         # Controls
         ttk.Button(game_frame, text="← Back", command=self.app.create_main_menu, 
-                  style="Primary.TButton").grid(row=2, column=0, columnspan=2, pady=20)
+                  style="Primary.TButton").pack(side="bottom", pady=20)
+        
+        # Create game board (scrolls when there are many pairs)
+        board_container = ttk.Frame(game_frame)
+        board_container.pack(fill="both", expand=True)
+        renderer = self.renderer.get()
+        if renderer not in RENDERERS:
+            renderer = "Canvas" if len(sample) > CANVAS_AUTO_PAIRS else "Buttons"
+        self.board = RENDERERS[renderer](board_container, self.app.ui_components, self.select_card)
+        self.card_pairs = self.board.build((cards1, cards2), (cat1, cat2), CARD_TEXT_LENGTH)
+        self.card_states = dict.fromkeys(self.card_pairs, 'normal')
+    
+    def set_card_state(self, card, state):
+        """Record and draw a card's state (one widget or canvas item update)"""
+        self.card_states[card] = state
+        self.board.paint(card, state)
     
-    def select_card(self, btn):
+    def select_card(self, card):
         """Handle card selection"""
-        if len(self.selected_cards) < 2 and btn not in self.selected_cards and btn['state'] != 'disabled':
-            self.selected_cards.append(btn)
-            btn.config(style="Selected.TButton")
+        if len(self.selected_cards) < 2 and card not in self.selected_cards and self.card_states[card] != 'matched':
+            self.selected_cards.append(card)
+            self.set_card_state(card, 'selected')
             
             if len(self.selected_cards) == 2:
                 self.app.root.after(500, self.check_match)
     
     def check_match(self):
-        """Check if cards match"""
+        """Check if cards match (same pair ID)"""
         if len(self.selected_cards) == 2:
             card1, card2 = self.selected_cards
-            match_found = False
             
-            for match in self.matches:
-                if ((str(match[0])[:50] == card1['text'] and str(match[1])[:50] == card2['text']) or
-                    (str(match[1])[:50] == card1['text'] and str(match[0])[:50] == card2['text'])):
-                    match_found = True
-                    break
-            
-            if match_found:
-                for btn in self.selected_cards:
-                    btn.config(state="disabled", style="Matched.TButton")
-                    if btn in self.card_buttons:
-                        self.card_buttons.remove(btn)
+            if self.card_pairs[card1] == self.card_pairs[card2]:
+                for card in self.selected_cards:
+                    self.set_card_state(card, 'matched')
+                self.remaining_pairs -= 1
                 
-                if not self.card_buttons:
+                if not self.remaining_pairs:
                     messagebox.showinfo("🎉 Congratulations!", "You matched all cards!")
                     self.app.create_main_menu()
             else:
-                for btn in self.selected_cards:
-                    btn.config(style="Error.TButton")
+                for card in self.selected_cards:
+                    self.set_card_state(card, 'error')
+                self.error_cards.extend(self.selected_cards)
                 self.app.root.after(1000, self.reset_selected_cards)
             
             self.selected_cards.clear()
     
     def reset_selected_cards(self):
         """Reset card appearance after error"""
-        for btn in self.card_buttons:
-            if btn.cget('style') == 'Error.TButton':
-                btn.config(style="TButton")
-
+        for card in self.error_cards:
+            if self.board.exists(card) and self.card_states.get(card) == 'error':
+                self.set_card_state(card, 'normal')
+        self.error_cards.clear()
@@ -1,10 +1,12 @@
 
 # progress_tracker.py - Progress tracking and statistics display
+import heapq
 import tkinter as tk
 from tkinter import messagebox, ttk
-import json
 from datetime import datetime
 
+from study_core import rollup_totals, week_start, write_json
+
 class ProgressTracker:
     """Handles progress tracking interface and statistics"""
     
@@ -12,11 +14,13 @@ class ProgressTracker:
         self.app = app
     
     def open_progress_tracker(self):
-        """Open progress tracking interface"""
-        self.app.clear_window()
-        
+        """Open progress tracking interface (rebuilt each time from current stats)"""
+        self.app.show_screen('progress_tracker', self.build_progress_tracker, rebuild=True)
+    
+    def build_progress_tracker(self, screen):
+        """Create the progress tracker contents"""
         # Create scrollable frame
-        scrollable_frame = self.app.ui_components.create_scrollable_frame(self.app.root)
+        scrollable_frame = self.app.ui_components.create_scrollable_frame(screen)
         
         main_frame = ttk.Frame(scrollable_frame, padding="25")
         main_frame.pack(fill="both", expand=True)
@@ -46,6 +50,10 @@ class ProgressTracker:
         progress = self.app.progress_manager.progress
         total_accuracy = (progress['total_correct'] / max(progress['total_questions'], 1)) * 100
         
+        # Session counts come from the daily rollups, not the raw history
+        rollups = progress['daily_rollups']
+        this_week = rollup_totals(rollups, since=week_start())
+        
         stats_grid = ttk.Frame(stats_frame)
         stats_grid.pack(fill="x")
         
@@ -53,7 +61,9 @@ class ProgressTracker:
             ("📝 Questions", progress['total_questions']),
             ("✅ Correct", progress['total_correct']),
             ("🎯 Accuracy", f"{total_accuracy:.1f}%"),
-            ("📚 Sessions", len(progress['session_history']))
+            ("📚 Sessions", rollup_totals(rollups)['sessions']),
+            ("📅 This Week", f"{this_week['sessions']} sessions"),
+            ("🗓️ Days Studied", len(rollups))
         ]
         
         for i, (label, value) in enumerate(stats_data):
@@ -101,25 +111,21 @@ class ProgressTracker:
         ttk.Label(drug_frame, text="Drugs needing more practice (lowest accuracy first):",
                  font=('Arial', 11, 'bold')).pack(anchor="w", pady=(0, 10))
         
-        # Calculate drug stats
+        # Pick the 15 lowest-accuracy drugs without sorting every counter
+        catalog = self.app.data_manager.catalog
+        drug_performance = self.app.progress_manager.progress['drug_performance']
+        known = ((drug_id, perf) for drug_id, perf in drug_performance.items()
+                 if catalog.row_for_id(drug_id) is not None)
+        weakest = heapq.nsmallest(15, known, key=lambda item: item[1]['correct'] / max(item[1]['total'], 1))
+        
         drug_stats = []
-        for drug_idx, perf in self.app.progress_manager.progress['drug_performance'].items():
-            try:
-                idx = int(drug_idx)
-                if idx < len(self.app.data_manager.df):
-                    drug_name = self.app.data_manager.df.iloc[idx]['Generic Name']
-                    accuracy = (perf['correct'] / max(perf['total'], 1)) * 100
-                    drug_stats.append({
-                        'name': drug_name,
-                        'total': perf['total'],
-                        'correct': perf['correct'],
-                        'accuracy': accuracy
-                    })
-            except (ValueError, IndexError):
-                continue
-        
-        # Sort by accuracy (lowest first)
-        drug_stats.sort(key=lambda x: x['accuracy'])
+        for drug_id, perf in weakest:
+            drug_stats.append({
+                'name': catalog.value(catalog.row_for_id(drug_id), 'Generic Name'),
+                'total': perf['total'],
+                'correct': perf['correct'],
+                'accuracy': (perf['correct'] / max(perf['total'], 1)) * 100
+            })
         
         if drug_stats:
             drug_columns = ("Drug Name", "Questions", "Correct", "Accuracy")
@@ -129,7 +135,7 @@ class ProgressTracker:
                 drug_tree.heading(col, text=col)
                 drug_tree.column(col, width=150, anchor="center")
             
-            for drug in drug_stats[:15]:  # Show top 15 that need practice
+            for drug in drug_stats:
                 drug_tree.insert("", "end", values=(
                     drug['name'], drug['total'], drug['correct'], f"{drug['accuracy']:.1f}%"
                 ))
@@ -151,36 +157,30 @@ class ProgressTracker:
     def clear_progress(self):
         """Clear all progress data"""
         if messagebox.askyesno("Clear Progress", "⚠️ Clear ALL progress data? This cannot be undone!"):
-            self.app.progress_manager.progress = {
-                'total_questions': 0,
-                'total_correct': 0,
-                'session_history': [],
-                'drug_performance': {}
-            }
-            self.app.progress_manager.save_progress()
+            self.app.progress_manager.reset_progress()
             messagebox.showinfo("✅ Cleared", "All progress data cleared.")
             self.open_progress_tracker()
     
     def export_progress(self):
         """Export progress to JSON file"""
-        try:
-            progress = self.app.progress_manager.progress
-            export_data = {
-                'export_date': datetime.now().isoformat(),
-                'overall_stats': {
-                    'total_questions': progress['total_questions'],
-                    'total_correct': progress['total_correct'],
-                    'accuracy': (progress['total_correct'] / max(progress['total_questions'], 1)) * 100
-                },
-                'session_history': progress['session_history'],
-                'drug_performance': progress['drug_performance']
-            }
-            
-            filename = f"drug_study_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(filename, 'w') as f:
-                json.dump(export_data, f, indent=2)
-            
-            messagebox.showinfo("💾 Export Complete", f"Data exported to:\n{filename}")
-        except Exception as e:
-            messagebox.showerror("Export Error", f"Failed to export: {str(e)}")
-
+        progress = self.app.progress_manager.snapshot()
+        export_data = {
+            'export_date': datetime.now().isoformat(),
+            'overall_stats': {
+                'total_questions': progress['total_questions'],
+                'total_correct': progress['total_correct'],
+                'accuracy': (progress['total_correct'] / max(progress['total_questions'], 1)) * 100
+            },
+            'session_history': progress['session_history'],
+            'daily_rollups': progress['daily_rollups'],
+            'drug_performance': progress['drug_performance']
+        }
+        
+        filename = f"drug_study_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        self.app.scheduler.submit(
+            write_json, filename, export_data,
+            on_done=lambda _: messagebox.showinfo("💾 Export Complete", f"Data exported to:\n{filename}"),
+            on_error=lambda e: messagebox.showerror("Export Error", f"Failed to export: {str(e)}"),
+            on_cancel=lambda: messagebox.showinfo("Export Cancelled", "No file was written."),
+            description="Exporting progress...",
+            cancellable=True)
@@ -1,91 +1,82 @@
 # qa_practice.py - Q&A practice implementation
+import time
 import tkinter as tk
 from tkinter import messagebox, ttk
-import pandas as pd
-import random
+
+from study_core import iter_questions, review_questions
 
 class QAPractice:
     """Handles the Q&A practice functionality"""
     
     def __init__(self, app):
         self.app = app
-        self.current_questions = []
+        # Questions are drawn lazily; only the current one is kept
+        self.question_stream = None
+        # True when the stream holds due reviews rather than every question
+        self.due_review = False
+        self.current_question = None
         self.current_question_index = 0
         self.session_correct = 0
         self.session_total = 0
         self.answer_var = None
+        # time.monotonic() when the current question appeared
+        self.question_shown_at = None
+        # Widgets of the cached question screen
+        self.progress_label = None
+        self.question_label = None
+        self.answer_entry = None
     
     def open_qa_practice(self):
         """Open Q&A practice mode"""
-        selected_data = self.app.get_selected_data()
-        if selected_data.empty:
+        indices = self.app.get_selected_indices()
+        if not indices:
             return
         
-        self.generate_questions(selected_data)
+        catalog = self.app.data_manager.catalog
+        self.due_review = self.app.due_review_selected()
+        if self.due_review:
+            # Overdue and weak items first, then a few unseen ones
+            questions = review_questions(catalog, indices, self.app.progress_manager.progress['reviews'])
+        else:
+            # Shuffle, and also "Focus weak drugs", which the picker marks as Learn Mode only
+            questions = iter_questions(catalog, indices)
+        self.start_session(questions)
+    
+    def start_session(self, questions):
+        """Start a session drawing from an iterator of questions"""
+        self.question_stream = questions
         self.current_question_index = 0
         self.session_correct = 0
         self.session_total = 0
         
         self.show_question()
     
-    def generate_questions(self, data):
-        """Generate Q&A questions"""
-        self.current_questions = []
-        question_types = [
-            ("Generic Name", "Brand Name(s)", "What is the brand name for {}?"),
-            ("Brand Name(s)", "Generic Name", "What is the generic name for {}?"),
-            ("Generic Name", "Drug Class", "What drug class does {} belong to?"),
-            ("Generic Name", "Indication", "What is {} used for?"),
-            ("Generic Name", "Side Effects", "What are the main side effects of {}?"),
-            ("Drug Class", "Generic Name", "Name a drug from the {} class:"),
-        ]
-        
-        for _, row in data.iterrows():
-            for q_col, a_col, q_template in question_types:
-                if pd.notna(row[q_col]) and pd.notna(row[a_col]):
-                    question = {
-                        'question': q_template.format(row[q_col]),
-                        'correct_answer': str(row[a_col]),
-                        'drug_index': row.name,
-                        'type': f"{q_col}_to_{a_col}"
-                    }
-                    self.current_questions.append(question)
-        
-        random.shuffle(self.current_questions)
-    
-    def show_question(self):
-        """Display current question"""
-        if self.current_question_index >= len(self.current_questions):
-            self.end_qa_session()
-            return
-        
-        self.app.clear_window()
-        question = self.current_questions[self.current_question_index]
-        
-        main_frame = ttk.Frame(self.app.root, padding="30")
+    def build_question_screen(self, screen):
+        """Create the question widgets once; show_question only updates them"""
+        main_frame = ttk.Frame(screen, padding="30")
         main_frame.pack(fill="both", expand=True)
         
         # Progress
-        progress_text = f"Question {self.current_question_index + 1} of {len(self.current_questions)} | Score: {self.session_correct}/{self.session_total}"
         ttk.Label(main_frame, text="❓ Q&A Practice", style="Title.TLabel").pack(pady=(0, 10))
-        ttk.Label(main_frame, text=progress_text, font=('Arial', 12)).pack(pady=(0, 20))
+        self.progress_label = ttk.Label(main_frame, font=('Arial', 12))
+        self.progress_label.pack(pady=(0, 20))
         
         # Question
         question_frame = ttk.LabelFrame(main_frame, text="Question", padding="25")
         question_frame.pack(fill="x", pady=(0, 20))
-        ttk.Label(question_frame, text=question['question'], font=('Arial', 16), 
-                 wraplength=800, justify='center').pack()
+        self.question_label = ttk.Label(question_frame, font=('Arial', 16), 
+                                        wraplength=800, justify='center')
+        self.question_label.pack()
         
         # Answer input
         answer_frame = ttk.LabelFrame(main_frame, text="Your Answer", padding="20")
         answer_frame.pack(fill="x", pady=(0, 20))
         
         self.answer_var = tk.StringVar()
-        answer_entry = ttk.Entry(answer_frame, textvariable=self.answer_var, 
-                               font=('Arial', 14), width=50, justify='center')
-        answer_entry.pack(pady=10)
-        answer_entry.focus()
-        answer_entry.bind('<Return>', lambda e: self.check_qa_answer())
+        self.answer_entry = ttk.Entry(answer_frame, textvariable=self.answer_var, 
+                                      font=('Arial', 14), width=50, justify='center')
+        self.answer_entry.pack(pady=10)
+        self.answer_entry.bind('<Return>', lambda e: self.check_qa_answer())
         
         ttk.Label(answer_frame, text="💡 Press Enter to submit", 
                  font=('Arial', 10), foreground='gray').pack()
@@ -105,21 +96,48 @@ class QAPractice:
             ttk.Button(button_frame, text=text, command=command, 
                       style="Primary.TButton").pack(side="left", padx=5)
     
+    def show_question(self):
+        """Draw and display the next question"""
+        question = next(self.question_stream, None)
+        if question is None:
+            if self.current_question_index == 0:
+                self.question_stream = None
+                if self.due_review:
+                    messagebox.showinfo("🎉 All Caught Up", "Nothing is due for review right now.")
+                else:
+                    messagebox.showinfo("No Questions",
+                                        "The selected drugs have no complete question/answer pairs.")
+                self.app.create_main_menu()
+            else:
+                self.end_qa_session()
+            return
+        self.current_question = question
+        
+        self.app.show_screen('qa_practice', self.build_question_screen)
+        
+        progress_text = f"Question {self.current_question_index + 1} | Score: {self.session_correct}/{self.session_total}"
+        self.progress_label.config(text=progress_text)
+        self.question_label.config(text=question['question'])
+        self.answer_var.set("")
+        self.answer_entry.focus()
+        self.question_shown_at = time.monotonic()
+    
+    def record_attempt(self, question, is_correct, hinted=False, skipped=False):
+        """Log the attempt with the time since the question was shown"""
+        response_ms = round((time.monotonic() - self.question_shown_at) * 1000)
+        self.app.progress_manager.record_attempt(
+            question['drug_id'], question['type'], is_correct, response_ms, hinted, skipped)
+    
     def check_qa_answer(self):
         """Check user's answer"""
-        question = self.current_questions[self.current_question_index]
-        user_answer = self.answer_var.get().strip().lower()
-        correct_answer = question['correct_answer'].strip().lower()
-        
+        if self.question_stream is None:
+            return
+        question = self.current_question
         self.session_total += 1
         
-        # Check answer (with partial matching)
-        is_correct = False
-        if user_answer in correct_answer or correct_answer in user_answer:
-            is_correct = True
-        elif len(user_answer) > 3 and any(word in correct_answer.split() 
-                                        for word in user_answer.split() if len(word) > 3):
-            is_correct = True
+        # Check answer (typos, listed alternatives, partial lists and any drug of a class allowed)
+        is_correct = self.app.data_manager.check_answer(question, self.answer_var.get())
+        self.record_attempt(question, is_correct)
         
         if is_correct:
             self.session_correct += 1
@@ -128,19 +146,22 @@ class QAPractice:
             messagebox.showinfo("❌ Incorrect", 
                               f"Not quite right.\n\nCorrect: {question['correct_answer']}\nYours: {self.answer_var.get()}")
         
-        # Update drug performance tracking
-        self.app.progress_manager.update_drug_performance(question['drug_index'], is_correct)
-        
         self.next_qa_question()
     
     def show_qa_answer(self):
         """Show correct answer"""
-        question = self.current_questions[self.current_question_index]
+        if self.question_stream is None:
+            return
+        question = self.current_question
+        self.record_attempt(question, False, hinted=True)
         messagebox.showinfo("💡 Answer", f"Correct answer: {question['correct_answer']}")
         self.next_qa_question()
     
     def skip_qa_question(self):
         """Skip current question"""
+        if self.question_stream is None:
+            return
+        self.record_attempt(self.current_question, False, skipped=True)
         self.next_qa_question()
     
     def next_qa_question(self):
@@ -150,6 +171,8 @@ class QAPractice:
     
     def end_qa_session(self):
         """End Q&A session and show results"""
+        self.question_stream = None
+        
         # Update progress
         self.app.progress_manager.update_session_stats(self.session_correct, self.session_total)
         self.app.progress_manager.record_session('qa_practice', self.session_correct, self.session_total)
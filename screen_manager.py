@@ -0,0 +1,38 @@
+# screen_manager.py - Cached screen frames raised instead of destroyed and rebuilt
+from tkinter import ttk
+
+
+class ScreenManager:
+    """Builds each screen once into a stacked frame and raises it on demand"""
+
+    def __init__(self, root):
+        self.root = root
+        self.container = ttk.Frame(root)
+        self.container.grid(row=0, column=0, sticky="nsew")
+        self.container.grid_rowconfigure(0, weight=1)
+        self.container.grid_columnconfigure(0, weight=1)
+        root.grid_rowconfigure(0, weight=1)
+        root.grid_columnconfigure(0, weight=1)
+
+        self.screens = {}
+        self.current = None
+
+    def show(self, name, build, rebuild=False):
+        """Raise a screen, calling build(frame) the first time (or every time if rebuild)"""
+        frame = self.screens.get(name)
+        if frame is None:
+            frame = ttk.Frame(self.container)
+            frame.grid(row=0, column=0, sticky="nsew")
+            self.screens[name] = frame
+            build(frame)
+        elif rebuild:
+            for widget in frame.winfo_children():
+                widget.destroy()
+            build(frame)
+
+        if self.current != name:
+            frame.tkraise()
+            # Take focus from widgets on the screen being hidden so their key bindings stop firing
+            frame.focus_set()
+            self.current = name
+        return frame
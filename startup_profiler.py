@@ -0,0 +1,63 @@
+# startup_profiler.py - Import and init timing breakdown for --profile-startup
+import threading
+import time
+from contextlib import contextmanager
+
+# Time from process start to the main menu being drawn
+STARTUP_BUDGET_MS = 500.0
+
+
+class StartupProfiler:
+    """Collects named timing steps; does nothing unless enabled"""
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.start = time.perf_counter()
+        self.steps = []
+        self.marks = {}
+        self.reported = False
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def step(self, name):
+        """Time the body of a with-block as one step"""
+        if not self.enabled:
+            yield
+            return
+
+        begin = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            with self.lock:
+                self.steps.append((name, (begin - self.start) * 1000, (end - begin) * 1000,
+                                   threading.current_thread().name))
+
+    def mark(self, name):
+        """Record a point in time, such as the first paint"""
+        if self.enabled:
+            with self.lock:
+                self.marks[name] = (time.perf_counter() - self.start) * 1000
+
+    def report(self):
+        """Print the breakdown once"""
+        if not self.enabled or self.reported:
+            return
+        self.reported = True
+
+        with self.lock:
+            steps = sorted(self.steps, key=lambda step: step[1])
+            marks = sorted(self.marks.items(), key=lambda mark: mark[1])
+
+        print("Startup profile (ms since launch)")
+        print(f"{'step':<36}{'start':>10}{'took':>10}  thread")
+        for name, begin, took, thread in steps:
+            print(f"{name:<36}{begin:>10.1f}{took:>10.1f}  {thread}")
+        for name, at in marks:
+            print(f"{name:<36}{at:>10.1f}")
+
+        first_paint = self.marks.get("first paint")
+        if first_paint is not None:
+            status = "OK" if first_paint <= STARTUP_BUDGET_MS else "OVER BUDGET"
+            print(f"first paint {first_paint:.1f} ms / budget {STARTUP_BUDGET_MS:.0f} ms: {status}")
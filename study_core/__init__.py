@@ -0,0 +1,33 @@
+# study_core - Headless drug study logic (no tkinter or pandas at import time)
+from .answers import FIELD_RULES, AnswerIndex, AnswerRule, bounded_edit_distance, check_answer
+from .attempts import ATTEMPT_FIELDS, AttemptBuffer
+from .autosave import AutosaveWriter
+from .boards import BoardGenerator
+from .catalog import (CATALOG_COLUMNS, Catalog, iter_catalog, load_catalog, make_drug_id,
+                      normalize_text, parse_catalog)
+from .membership import MembershipIndex
+from .progress import ProgressManager, apply_event, empty_progress, write_json
+from .profiles import DEFAULT_PROFILE, list_profiles, profile_path, profile_slug
+from .question_bank import QuestionBank, build_question_bank
+from .questions import ANSWER_FIELDS, QUESTION_TYPES, SparsePermutation, generate_questions, iter_questions
+from .review import (FLASHCARD_QTYPE, ReviewQueue, attempt_quality, review_cards, review_questions,
+                     sm2_review)
+from .rollups import (SESSION_RETENTION_DAYS, build_rollups, rollup_totals, week_start,
+                      weekly_rollups)
+from .sampling import AliasTable, SampledDeck, weakness_weights
+from .selection import SelectionModel
+from .sqlite_store import SQLiteProgressStore, import_json_progress
+
+__all__ = [
+    "CATALOG_COLUMNS", "Catalog", "iter_catalog", "load_catalog", "parse_catalog",
+    "make_drug_id", "normalize_text",
+    "SelectionModel", "AliasTable", "SampledDeck", "weakness_weights", "QUESTION_TYPES", "generate_questions", "iter_questions", "ANSWER_FIELDS",
+    "SparsePermutation", "QuestionBank", "build_question_bank", "check_answer",
+    "AnswerIndex", "AnswerRule", "FIELD_RULES", "bounded_edit_distance", "MembershipIndex",
+    "ProgressManager", "apply_event", "empty_progress", "write_json",
+    "SQLiteProgressStore", "import_json_progress", "AutosaveWriter",
+    "ATTEMPT_FIELDS", "AttemptBuffer", "BoardGenerator",
+    "DEFAULT_PROFILE", "list_profiles", "profile_path", "profile_slug",
+    "FLASHCARD_QTYPE", "ReviewQueue", "attempt_quality", "review_cards", "review_questions", "sm2_review",
+    "SESSION_RETENTION_DAYS", "build_rollups", "rollup_totals", "week_start", "weekly_rollups",
+]
@@ -0,0 +1,263 @@
+# answers.py - Answer checking for typed Q&A responses
+import re
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset({"a", "an", "and", "the", "of", "or", "to", "for", "in", "with"})
+# Words that join the items of a typed answer, besides the field's separators
+USER_JOINERS = r"\band\b|\bor\b|&"
+PARENTHESES_PATTERN = re.compile(r"\(([^)]*)\)")
+
+
+def normalize_tokens(text):
+    """Lowercase word tokens without punctuation or filler words"""
+    return tuple(token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS)
+
+
+def bounded_edit_distance(a, b, bound):
+    """Edit distance (with adjacent transpositions) between a and b, or bound + 1 once it exceeds bound
+
+    Only the diagonal band of width 2 * bound + 1 is computed and the scan
+    stops as soon as a whole row exceeds the bound, so short answers are
+    scored in a few microseconds.
+    """
+    if a == b:
+        return 0
+    if len(a) > len(b):
+        a, b = b, a
+    la, lb = len(a), len(b)
+    over = bound + 1
+    if lb - la > bound:
+        return over
+
+    before = None
+    previous = list(range(lb + 1))
+    for i in range(1, la + 1):
+        current = [over] * (lb + 1)
+        current[0] = i
+        ca = a[i - 1]
+        row_min = i if i <= bound else over
+        for j in range(max(1, i - bound), min(lb, i + bound) + 1):
+            cb = b[j - 1]
+            value = previous[j - 1] + (ca != cb)
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            if i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb and before[j - 2] + 1 < value:
+                value = before[j - 2] + 1
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > bound:
+            return over
+        before, previous = previous, current
+    return min(previous[lb], over)
+
+
+class AnswerRule:
+    """How one answer field is split into alternatives and how loosely answers may match
+
+    separators: characters that split the stored value into alternatives.
+    max_edit_ratio: allowed typos as a fraction of each word's length, summed
+        over the alternative's words, so leaving out or swapping a short word
+        ("prolongation" for "QT prolongation") is not taken for a typo.
+    item_coverage: if set, an answer may also name part of an alternative
+        (e.g. "severe dry cough" for "persistent severe dry cough") when it
+        covers at least this fraction of that alternative's words, at least
+        MIN_COVERED_WORDS of them, and every word it uses is in it. A single
+        shared word ("heart" for "heart failure") is never enough.
+    first_word: also accept the first word of multi-word alternatives
+        ("Glucotrol" for "Glucotrol XL").
+    """
+
+    def __init__(self, separators=",;", max_edit_ratio=0.2, item_coverage=None, first_word=False):
+        self.split_pattern = re.compile(f"[{re.escape(separators)}]")
+        self.user_item_pattern = re.compile(f"[{re.escape(separators)}]|{USER_JOINERS}")
+        self.max_edit_ratio = max_edit_ratio
+        self.item_coverage = item_coverage
+        self.first_word = first_word
+
+    def bound(self, text):
+        """Number of edits allowed when matching against text"""
+        return sum(int(len(word) * self.max_edit_ratio) for word in text.split())
+
+
+# Partial answers must name at least this many words of the alternative
+MIN_COVERED_WORDS = 2
+
+DEFAULT_RULE = AnswerRule()
+# Per answer column; tune thresholds here
+FIELD_RULES = {
+    'Generic Name': AnswerRule(),
+    'Brand Name(s)': AnswerRule(first_word=True),
+    'Drug Class': AnswerRule(separators=",;/", max_edit_ratio=0.25),
+    'Indication': AnswerRule(item_coverage=0.5),
+    'Side Effects': AnswerRule(item_coverage=0.5),
+}
+
+
+class Alternatives:
+    """The normalized ways one stored value may be answered"""
+
+    def __init__(self, value, rule):
+        self.rule = rule
+        items = {}
+        for part in rule.split_pattern.split(value):
+            variants = [part, PARENTHESES_PATTERN.sub(" ", part)]
+            variants.extend(PARENTHESES_PATTERN.findall(part))
+            for variant in variants:
+                tokens = normalize_tokens(variant)
+                if tokens:
+                    items[" ".join(tokens)] = tokens
+                    if rule.first_word and len(tokens) > 1 and len(tokens[0]) >= 4:
+                        items[tokens[0]] = tokens[:1]
+        tokens = normalize_tokens(value)
+        if tokens:
+            items[" ".join(tokens)] = tokens
+        self.items = items
+
+    def match(self, user_answer):
+        """True if the whole answer, or every item listed in it, matches one of the alternatives"""
+        tokens = normalize_tokens(user_answer)
+        if not tokens:
+            return False
+        if self.match_item(tokens):
+            return True
+        user_items = [normalize_tokens(part) for part in self.rule.user_item_pattern.split(user_answer.lower())]
+        user_items = [tokens for tokens in user_items if tokens]
+        return len(user_items) > 1 and all(self.match_item(tokens) for tokens in user_items)
+
+    def match_item(self, tokens):
+        text = " ".join(tokens)
+        if text in self.items:
+            return True
+
+        rule = self.rule
+        for alternative in self.items:
+            bound = rule.bound(alternative)
+            if bounded_edit_distance(text, alternative, bound) <= bound:
+                return True
+
+        if rule.item_coverage is not None:
+            for alternative_tokens in self.items.values():
+                if self.covers(tokens, alternative_tokens):
+                    return True
+        return False
+
+    def covers(self, tokens, alternative_tokens):
+        """True if every user word fuzzily appears in the alternative and covers enough of it"""
+        matched = set()
+        for token in tokens:
+            for position, candidate in enumerate(alternative_tokens):
+                bound = self.rule.bound(candidate)
+                if bounded_edit_distance(token, candidate, bound) <= bound:
+                    matched.add(position)
+                    break
+            else:
+                return False
+        return (len(matched) >= MIN_COVERED_WORDS
+                and len(matched) / len(alternative_tokens) >= self.rule.item_coverage)
+
+
+def trigrams(text):
+    """Character trigrams of text padded with spaces"""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class AnswerIndex:
+    """Answer alternatives per stored value, plus row and trigram indexes per answer field
+
+    Alternatives are parsed the first time a value is checked and then
+    cached, so checking an answer never re-parses the catalog text. The row
+    and trigram indexes map a field's alternatives back to catalog rows for
+    fuzzy lookups; they are built only for the fields that need them.
+    """
+
+    def __init__(self, catalog, rules=FIELD_RULES):
+        self.catalog = catalog
+        self.rules = rules
+        self.alternatives = {}
+        self.alternative_rows = {}
+        self.trigram_index = {}
+
+    def build(self, fields):
+        """Precompute the row and trigram indexes of the fields that lookups search"""
+        for field in fields:
+            self.field_trigrams(field)
+
+    def rule(self, field):
+        return self.rules.get(field, DEFAULT_RULE)
+
+    def value_alternatives(self, field, value):
+        """Alternatives for one stored value of a field (parsed on first use)"""
+        by_value = self.alternatives.setdefault(field, {})
+        alternatives = by_value.get(value)
+        if alternatives is None:
+            alternatives = by_value[value] = Alternatives(value, self.rule(field))
+        return alternatives
+
+    def field_rows(self, field):
+        """Normalized alternative -> catalog rows for a field (built on first use)"""
+        rows = self.alternative_rows.get(field)
+        if rows is None:
+            rows = {}
+            for row, value in enumerate(self.catalog.columns[field]):
+                for text in self.value_alternatives(field, value).items:
+                    rows.setdefault(text, []).append(row)
+            self.alternative_rows[field] = rows
+        return rows
+
+    def field_trigrams(self, field):
+        """Trigram -> set of alternative strings for a field"""
+        index = self.trigram_index.get(field)
+        if index is None:
+            index = {}
+            for text in self.field_rows(field):
+                for gram in trigrams(text):
+                    index.setdefault(gram, set()).add(text)
+            self.trigram_index[field] = index
+        return index
+
+    def check(self, user_answer, correct_answer, field=None):
+        """True if user_answer is an acceptable answer for correct_answer in field"""
+        if field is None:
+            return check_answer(user_answer, correct_answer)
+        return self.value_alternatives(field, correct_answer).match(user_answer)
+
+    def lookup(self, field, user_answer, min_shared=0.5):
+        """Return the sorted catalog rows whose field has an alternative matching user_answer
+
+        Exact alternatives are a dict hit; otherwise the trigram index narrows
+        the candidates to those sharing at least min_shared of the answer's
+        trigrams before the bounded edit distance confirms them.
+        """
+        text = " ".join(normalize_tokens(user_answer))
+        if not text:
+            return []
+        rows_by_text = self.field_rows(field)
+        if text in rows_by_text:
+            return sorted(rows_by_text[text])
+
+        grams = trigrams(text)
+        shared = {}
+        index = self.field_trigrams(field)
+        for gram in grams:
+            for candidate in index.get(gram, ()):
+                shared[candidate] = shared.get(candidate, 0) + 1
+
+        rule = self.rule(field)
+        needed = len(grams) * min_shared
+        rows = set()
+        for candidate, count in shared.items():
+            if count >= needed:
+                bound = rule.bound(candidate)
+                if bounded_edit_distance(text, candidate, bound) <= bound:
+                    rows.update(rows_by_text[candidate])
+        return sorted(rows)
+
+
+def check_answer(user_answer, correct_answer, field=None):
+    """Return True if a typed answer matches the correct one (typos and listed alternatives allowed)"""
+    rule = FIELD_RULES.get(field, DEFAULT_RULE)
+    return Alternatives(correct_answer, rule).match(user_answer)
@@ -0,0 +1,59 @@
+# attempts.py - Compact per-attempt records and the ring buffer that batches them
+ATTEMPT_FIELDS = ('date', 'drug_id', 'qtype', 'correct', 'response_ms', 'hinted', 'skipped')
+
+
+def make_attempt(date, drug_id, qtype, correct, response_ms=None, hinted=False, skipped=False):
+    """Return an attempt as a plain tuple in ATTEMPT_FIELDS order"""
+    return (date, drug_id, qtype, 1 if correct else 0, response_ms, 1 if hinted else 0, 1 if skipped else 0)
+
+
+def attempt_event(attempt):
+    """Turn an attempt tuple into an 'answer' progress event"""
+    event = dict(zip(ATTEMPT_FIELDS, attempt))
+    event['op'] = 'answer'
+    return event
+
+
+def event_attempt(event):
+    """Turn an 'answer' progress event back into an attempt tuple"""
+    return make_attempt(event['date'], event['drug_id'], event.get('qtype'), event['correct'],
+                        event.get('response_ms'), event.get('hinted', False), event.get('skipped', False))
+
+
+def counts_toward_score(attempt):
+    """Revealed and skipped questions are logged but not scored"""
+    return not attempt[5] and not attempt[6]
+
+
+class AttemptBuffer:
+    """Fixed-size ring buffer of attempt tuples
+
+    append() is O(1) and never allocates beyond the preallocated slots;
+    drain() hands the buffered attempts to the writer in recording order.
+    The caller provides the locking.
+    """
+
+    def __init__(self, capacity=512):
+        self.slots = [None] * capacity
+        self.start = 0
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def append(self, attempt):
+        """Store an attempt; returns True when the buffer is now full"""
+        self.slots[(self.start + self.size) % len(self.slots)] = attempt
+        self.size += 1
+        return self.size == len(self.slots)
+
+    def drain(self):
+        """Return and remove every buffered attempt, oldest first"""
+        end = self.start + self.size
+        if end <= len(self.slots):
+            attempts = self.slots[self.start:end]
+        else:
+            attempts = self.slots[self.start:] + self.slots[:end - len(self.slots)]
+        self.start = end % len(self.slots)
+        self.size = 0
+        return attempts
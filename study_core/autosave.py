@@ -0,0 +1,74 @@
+# autosave.py - Debounced background writer for progress changes
+import threading
+import time
+
+
+class AutosaveWriter:
+    """Runs flush() on its own thread, coalescing changes between flushes
+
+    Callers only mark work as dirty (O(1), never touching the disk). The
+    thread flushes once max_delay seconds have passed since the first unsaved
+    change, as soon as max_events changes are pending, or when a flush is
+    requested explicitly; stop() performs a final flush before returning.
+    """
+
+    def __init__(self, flush, max_delay=5.0, max_events=25):
+        self.flush = flush
+        self.max_delay = max_delay
+        self.max_events = max_events
+        self.condition = threading.Condition()
+        self.dirty_since = None
+        self.dirty_events = 0
+        self.flush_requested = False
+        self.stopping = False
+        self.thread = threading.Thread(target=self.run, name="progress-autosave", daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def mark_dirty(self, count=1):
+        """Note unsaved changes; wakes the writer once the event limit is reached"""
+        with self.condition:
+            if self.dirty_since is None:
+                self.dirty_since = time.monotonic()
+                self.condition.notify()
+            self.dirty_events += count
+            if self.dirty_events >= self.max_events:
+                self.condition.notify()
+
+    def request_flush(self):
+        """Flush as soon as possible without waiting for it"""
+        with self.condition:
+            self.flush_requested = True
+            self.condition.notify()
+
+    def stop(self, timeout=None):
+        """Flush anything pending and end the writer thread"""
+        with self.condition:
+            self.stopping = True
+            self.condition.notify()
+        if self.thread.is_alive():
+            self.thread.join(timeout)
+
+    def run(self):
+        while True:
+            with self.condition:
+                while not self.flush_due():
+                    if self.dirty_since is None:
+                        self.condition.wait()
+                    else:
+                        self.condition.wait(self.dirty_since + self.max_delay - time.monotonic())
+                stopping = self.stopping
+                self.dirty_since = None
+                self.dirty_events = 0
+                self.flush_requested = False
+
+            self.flush()
+            if stopping:
+                return
+
+    def flush_due(self):
+        """True when the writer should flush now (called with the condition held)"""
+        if self.stopping or self.flush_requested or self.dirty_events >= self.max_events:
+            return True
+        return self.dirty_since is not None and time.monotonic() - self.dirty_since >= self.max_delay
@@ -0,0 +1,89 @@
+# boards.py - Matching-game boards without look-alike cards
+import random
+from itertools import combinations
+
+from .answers import normalize_tokens
+from .questions import SparsePermutation
+
+
+def value_key(value):
+    """Grouping key for a card value: case, punctuation and spacing ignored"""
+    return " ".join(normalize_tokens(value))
+
+
+class BoardGenerator:
+    """Picks matching-game pairs whose cards are unique on both sides of the board
+
+    Values are grouped by normalized key, so two cards that read the same
+    (the repeated "Hypotension, hyperkalemia, ..." side effects, say) never
+    appear together. Keys are computed once per column and reused for every
+    board and capacity report. With text_length set, keys are taken from the
+    first text_length characters, i.e. what a truncated card shows.
+    """
+
+    def __init__(self, catalog, text_length=None):
+        self.catalog = catalog
+        self.text_length = text_length
+        self.column_keys = {}
+
+    def keys(self, column):
+        """Normalized key of every row's value in a column (built on first use)"""
+        keys = self.column_keys.get(column)
+        if keys is None:
+            keys = self.column_keys[column] = [value_key(value[:self.text_length])
+                                               for value in self.catalog.columns[column]]
+        return keys
+
+    def candidate_pairs(self, indices, left, right):
+        """Distinct (left key, right key) pairs -> first row that has them; rows missing a value are skipped"""
+        left_keys = self.keys(left)
+        right_keys = self.keys(right)
+        pairs = {}
+        for idx in indices:
+            left_key, right_key = left_keys[idx], right_keys[idx]
+            if left_key and right_key:
+                pairs.setdefault((left_key, right_key), idx)
+        return pairs
+
+    def draw(self, indices, left, right, num_pairs, rng=random):
+        """Return up to num_pairs rows for a board, in random order, no two sharing a key on either side
+
+        Candidates are visited through a lazy permutation and kept when
+        neither key is on the board yet, so drawing k pairs costs about O(k)
+        after one O(n) pass to group the candidates.
+        """
+        pairs = list(self.candidate_pairs(indices, left, right).items())
+        used_left, used_right = set(), set()
+        rows = []
+        for position in SparsePermutation(len(pairs), rng):
+            if len(rows) >= num_pairs:
+                break
+            (left_key, right_key), idx = pairs[position]
+            if left_key not in used_left and right_key not in used_right:
+                used_left.add(left_key)
+                used_right.add(right_key)
+                rows.append(idx)
+        return rows
+
+    def capacity(self, indices, left, right):
+        """How many unique pairs one board of these columns can hold for the given rows
+
+        Greedy matching that takes pairs with the rarest keys first: O(n log n),
+        never below half the true maximum and usually equal to it.
+        """
+        pairs = self.candidate_pairs(indices, left, right)
+        left_degree, right_degree = {}, {}
+        for left_key, right_key in pairs:
+            left_degree[left_key] = left_degree.get(left_key, 0) + 1
+            right_degree[right_key] = right_degree.get(right_key, 0) + 1
+
+        used_left, used_right = set(), set()
+        for left_key, right_key in sorted(pairs, key=lambda pair: left_degree[pair[0]] + right_degree[pair[1]]):
+            if left_key not in used_left and right_key not in used_right:
+                used_left.add(left_key)
+                used_right.add(right_key)
+        return len(used_left)
+
+    def capacities(self, indices, columns):
+        """Unique-pair capacity of every column combination (the same in either direction)"""
+        return {(left, right): self.capacity(indices, left, right) for left, right in combinations(columns, 2)}
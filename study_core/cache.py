@@ -0,0 +1,106 @@
+# cache.py - Compiled on-disk snapshot of the parsed drug catalog
+import marshal
+import mmap
+import os
+import struct
+import sys
+
+CACHE_SUFFIX = ".cache"
+CACHE_MAGIC = b"DRUGCAT\x00"
+CACHE_VERSION = 3
+# marshal data is only guaranteed to load under the interpreter that wrote it
+INTERPRETER = (marshal.version,) + tuple(sys.version_info[:2])
+
+# magic, version, marshal version, Python major, minor, source size, source mtime (ns),
+# source sha256, payload length
+HEADER = struct.Struct("<8sIIBBQq32sQ")
+
+
+def cache_path_for(source_path):
+    """Return the snapshot path that sits next to the source CSV"""
+    return source_path + CACHE_SUFFIX
+
+
+def file_digest(path):
+    """Return the sha256 digest of a file"""
+    import hashlib
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def read_snapshot(source_path):
+    """Return (columns, section_ranges, drug IDs) from a valid snapshot, or None
+
+    A snapshot is valid when it was written by the same marshal format and
+    Python version and the source size and mtime match its header. If
+    only the mtime changed (a touch or fresh checkout), the content hash
+    decides and the header is refreshed so the next start takes the fast path.
+    """
+    cache_path = cache_path_for(source_path)
+    try:
+        stat = os.stat(source_path)
+        with open(cache_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if len(mm) < HEADER.size:
+                    return None
+                magic, version, *interpreter, size, mtime_ns, digest, length = HEADER.unpack_from(mm)
+                if magic != CACHE_MAGIC or version != CACHE_VERSION or tuple(interpreter) != INTERPRETER:
+                    return None
+                if size != stat.st_size:
+                    return None
+                if HEADER.size + length != len(mm):
+                    return None
+
+                fresh = mtime_ns == stat.st_mtime_ns
+                if not fresh and file_digest(source_path) != digest:
+                    return None
+
+                # marshal reads straight out of the mapped pages
+                with memoryview(mm) as view:
+                    payload = marshal.loads(view[HEADER.size:])
+        columns, section_ranges, ids = payload['columns'], payload['sections'], payload['ids']
+    except (OSError, ValueError, EOFError, TypeError, KeyError):
+        return None
+
+    if not fresh:
+        write_snapshot(source_path, columns, section_ranges, ids, stat, digest)
+
+    return columns, section_ranges, ids
+
+
+def write_snapshot(source_path, columns, section_ranges, ids, stat, digest):
+    """Atomically write a snapshot keyed by the source stat and digest"""
+    cache_path = cache_path_for(source_path)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        payload = marshal.dumps({'columns': columns, 'sections': section_ranges, 'ids': ids})
+        header = HEADER.pack(CACHE_MAGIC, CACHE_VERSION, *INTERPRETER, stat.st_size,
+                             stat.st_mtime_ns, digest, len(payload))
+        with open(tmp_path, 'wb') as f:
+            f.write(header)
+            f.write(payload)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Failed to write catalog cache: {str(e)}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def load_compiled_catalog(source_path, parse):
+    """Load (columns, section_ranges, drug IDs) from the snapshot, re-parsing the CSV when stale"""
+    snapshot = read_snapshot(source_path)
+    if snapshot is not None:
+        return snapshot
+
+    # Key the snapshot by the file as it was before parsing
+    stat = os.stat(source_path)
+    digest = file_digest(source_path)
+    columns, section_ranges, ids = parse(source_path)
+    write_snapshot(source_path, columns, section_ranges, ids, stat, digest)
+    return columns, section_ranges, ids
@@ -0,0 +1,147 @@
+# catalog.py - Drug catalog parsing and column storage
+from .cache import load_compiled_catalog
+
+CATALOG_COLUMNS = [
+    "Generic Name", "Brand Name(s)", "Drug Class", "Dosage Forms",
+    "Indication", "Side Effects", "Clinical Pearls"
+]
+
+
+def normalize_text(text):
+    """Lowercase and collapse whitespace for comparisons and hashing"""
+    return " ".join(str(text).lower().split())
+
+
+def make_drug_id(generic_name):
+    """Return a stable content-addressed ID for a drug from its generic name"""
+    import hashlib
+
+    normalized = normalize_text(generic_name).encode('utf-8')
+    return hashlib.blake2b(normalized, digest_size=8).hexdigest()
+
+
+def iter_catalog(f):
+    """Yield (section, record) tuples from an open catalog file
+
+    Rows are parsed with the csv module so quoted fields such as
+    "Prinivil, Zestril" stay intact. Only the current row is held in memory.
+    """
+    # Imported here: csv pulls in re/enum, which only a cache miss needs
+    import csv
+
+    section_name = None
+    width = len(CATALOG_COLUMNS)
+
+    for row in csv.reader(f):
+        if not row:
+            continue
+
+        first = row[0].lstrip()
+        if first.startswith("#"):
+            # New section header (rejoin in case the title contains commas)
+            section_name = ",".join(row).strip()[1:].strip()
+        elif section_name and first and first.lower() != "generic name":
+            # Only yield real data rows (skip repeated headers)
+            if len(row) != width:
+                row = (row + [""] * width)[:width]
+            yield section_name, row
+
+
+def parse_catalog(file_path):
+    """Parse a catalog file into column lists and contiguous section row ranges"""
+    # Stream rows straight into column lists
+    columns = {name: [] for name in CATALOG_COLUMNS}
+    column_lists = [columns[name] for name in CATALOG_COLUMNS]
+    section_column = []
+    section_ranges = []
+
+    with open(file_path, 'r', encoding='utf-8', newline='') as f:
+        for row_index, (section, record) in enumerate(iter_catalog(f)):
+            for values, value in zip(column_lists, record):
+                values.append(value)
+            section_column.append(section)
+
+            # Extend the current run or start a new one at this row
+            if section_ranges and section_ranges[-1][0] == section:
+                section_ranges[-1][2] = row_index + 1
+            else:
+                section_ranges.append([section, row_index, row_index + 1])
+
+    columns['Section'] = section_column
+    return columns, section_ranges
+
+
+def compile_catalog(file_path):
+    """Parse a catalog file plus the drug IDs the compiled snapshot stores with it"""
+    columns, section_ranges = parse_catalog(file_path)
+    return columns, section_ranges, [make_drug_id(name) for name in columns['Generic Name']]
+
+
+def build_section_index(section_ranges):
+    """Map each section name to its list of (start, stop) row ranges"""
+    section_index = {}
+    for name, start, stop in section_ranges:
+        section_index.setdefault(name, []).append((start, stop))
+    return section_index
+
+
+class Catalog:
+    """Column-oriented drug catalog with a section index
+
+    Drug IDs are hashed from the generic names unless given (the compiled
+    snapshot stores them).
+    """
+
+    def __init__(self, columns, section_ranges, ids=None):
+        self.columns = columns
+        self.section_ranges = section_ranges
+        self.section_index = build_section_index(section_ranges)
+
+        # Stable drug IDs and their reverse lookup (first row wins on duplicates)
+        if ids is None:
+            ids = [make_drug_id(name) for name in columns['Generic Name']]
+        self.ids = ids
+        self.id_index = {}
+        for idx, drug_id in enumerate(self.ids):
+            self.id_index.setdefault(drug_id, idx)
+
+    def __len__(self):
+        return len(self.columns['Section'])
+
+    @property
+    def column_names(self):
+        """All column names, catalog fields first"""
+        return CATALOG_COLUMNS + ['Section']
+
+    def value(self, idx, column):
+        """Return a single field"""
+        return self.columns[column][idx]
+
+    def row_for_id(self, drug_id):
+        """Return the row position for a drug ID, or None if it is not in the catalog"""
+        return self.id_index.get(drug_id)
+
+    def record(self, idx):
+        """Return one drug as a {column: value} dict"""
+        return {name: values[idx] for name, values in self.columns.items()}
+
+    def section_rows(self, section_name):
+        """Iterate the row positions of a section"""
+        for start, stop in self.section_index[section_name]:
+            yield from range(start, stop)
+
+    def section_size(self, section_name):
+        """Number of drugs in a section"""
+        return sum(stop - start for start, stop in self.section_index[section_name])
+
+    def to_dataframe(self):
+        """Build a pandas DataFrame of the whole catalog (imports pandas)"""
+        import pandas as pd
+        return pd.DataFrame(self.columns, columns=self.column_names)
+
+
+def load_catalog(file_path, use_cache=True):
+    """Load a catalog, going through the compiled snapshot when allowed"""
+    if use_cache:
+        return Catalog(*load_compiled_catalog(file_path, compile_catalog))
+    return Catalog(*parse_catalog(file_path))
@@ -0,0 +1,54 @@
+# filelock.py - Cross-process advisory lock on a sidecar file
+import errno
+import os
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+
+class FileLock:
+    """Exclusive lock held by one process at a time (fcntl on POSIX, msvcrt on Windows)
+
+    Used as a context manager around short write transactions. The lock file
+    is created next to the data file and never deleted, so every process
+    locks the same inode.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.fd = None
+
+    def __enter__(self):
+        self.fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(self.fd, fcntl.LOCK_EX)
+            else:
+                # LK_LOCK retries for about 10 seconds before raising; keep waiting while
+                # another process holds the lock, but fail on any other error
+                while True:
+                    try:
+                        msvcrt.locking(self.fd, msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError as e:
+                        if e.errno not in (errno.EDEADLOCK, errno.EACCES):
+                            raise
+        except BaseException:
+            os.close(self.fd)
+            self.fd = None
+            raise
+        return self
+
+    def __exit__(self, *exc):
+        try:
+            if fcntl is not None:
+                fcntl.flock(self.fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(self.fd, 0, os.SEEK_SET)
+                msvcrt.locking(self.fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(self.fd)
+            self.fd = None
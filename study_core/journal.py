@@ -0,0 +1,49 @@
+# journal.py - Reader for the legacy JSON snapshot plus JSON-lines event journal
+import json
+import os
+import time
+
+
+def load_journal(snapshot_path):
+    """Return (snapshot dict or None, journal events newer than the snapshot)
+
+    Every event carries a sequence number and the snapshot records the last
+    one folded into it, so events the snapshot already contains are skipped.
+    """
+    snapshot = read_snapshot(snapshot_path)
+    snapshot_seq = snapshot.get('journal_seq', 0) if snapshot else 0
+
+    events = [event for event in read_journal(snapshot_path + ".journal") if event['seq'] > snapshot_seq]
+    events.sort(key=lambda event: event['seq'])
+    return snapshot, events
+
+
+def read_snapshot(path):
+    """Read the snapshot, moving an unreadable one aside instead of discarding it"""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except ValueError as e:
+        corrupt_path = f"{path}.corrupt-{int(time.time())}"
+        os.replace(path, corrupt_path)
+        print(f"Progress snapshot is unreadable ({str(e)}); kept as {corrupt_path}")
+        return None
+
+
+def read_journal(path):
+    """Read journal events, ignoring a torn final line left by a crash"""
+    events = []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.endswith("\n"):
+                    break
+                try:
+                    events.append(json.loads(line))
+                except ValueError:
+                    break
+    except FileNotFoundError:
+        pass
+    return events
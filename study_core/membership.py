@@ -0,0 +1,88 @@
+# membership.py - Inverted indexes for one-to-many questions and brand -> generic lookups
+from .answers import bounded_edit_distance, normalize_tokens
+
+GROUP_FIELD = 'Drug Class'
+# Any of these names a member of the group
+MEMBER_FIELDS = ('Generic Name', 'Brand Name(s)')
+
+
+def group_key(value):
+    """Normalized form of a group value ('Beta-blocker' and 'beta blocker' share a key)"""
+    return " ".join(normalize_tokens(value))
+
+
+def group_keys(value, split_pattern):
+    """Keys a row is filed under: the whole value and each of its components
+
+    "Anticonvulsant/Mood Stabilizer" is a member of "Anticonvulsant", of
+    "Mood Stabilizer" and of the compound class itself.
+    """
+    keys = [group_key(value)]
+    keys.extend(group_key(part) for part in split_pattern.split(value))
+    return [key for key in dict.fromkeys(keys) if key]
+
+
+class MembershipIndex:
+    """Drug class -> every generic name and brand alias of its members
+
+    Built once from an AnswerIndex, reusing its parsed alternatives, so a
+    "Name a drug from the {} class" answer is accepted for any member of the
+    class with one dict lookup. Compound classes are split with the group
+    field's answer rule, the same way check_answer splits them. Typos are
+    matched by bounded edit distance against the class's own names, so a
+    check costs time in proportion to the class, not the catalog.
+    """
+
+    def __init__(self, answer_index, group_field=GROUP_FIELD, member_fields=MEMBER_FIELDS):
+        self.answer_index = answer_index
+        self.group_field = group_field
+        self.member_fields = member_fields
+        self.group_names = {}
+
+    def build(self):
+        """Precompute group -> accepted normalized names with their typo bounds"""
+        catalog = self.answer_index.catalog
+        split_pattern = self.answer_index.rule(self.group_field).split_pattern
+        value_keys = {}
+        row_groups = []
+        for value in catalog.columns[self.group_field]:
+            keys = value_keys.get(value)
+            if keys is None:
+                keys = value_keys[value] = group_keys(value, split_pattern)
+            row_groups.append(keys)
+
+        group_names = {key: {} for keys in value_keys.values() for key in keys}
+        for field in self.member_fields:
+            rule = self.answer_index.rule(field)
+            for text, rows in self.answer_index.field_rows(field).items():
+                bound = rule.bound(text)
+                for row in rows:
+                    for key in row_groups[row]:
+                        names = group_names[key]
+                        if names.get(text, -1) < bound:
+                            names[text] = bound
+
+        self.group_names = group_names
+        return self
+
+    def handles(self, question):
+        """True if question asks for any member of a group"""
+        return (question.get('question_field') == self.group_field
+                and question.get('answer_field') in self.member_fields)
+
+    def accepts(self, group_value, user_answer):
+        """True if user_answer names (possibly with a typo) any member of the group"""
+        names = self.group_names.get(group_key(group_value), {})
+        text = " ".join(normalize_tokens(user_answer))
+        if not text:
+            return False
+        if text in names:
+            return True
+        return any(abs(len(name) - len(text)) <= bound and bounded_edit_distance(text, name, bound) <= bound
+                   for name, bound in names.items())
+
+    def generic_names(self, brand):
+        """Generic names sold under a brand (exact alias first, then a fuzzy match)"""
+        generics = self.answer_index.catalog.columns['Generic Name']
+        rows = self.answer_index.lookup('Brand Name(s)', brand)
+        return list(dict.fromkeys(generics[row] for row in rows if generics[row]))
@@ -0,0 +1,32 @@
+# profiles.py - Per-user progress databases
+import os
+import re
+
+DEFAULT_PROFILE = "default"
+PROFILE_DIR = "profiles"
+# The default profile keeps the original file name so existing progress carries over
+DEFAULT_PROGRESS_FILE = "study_progress.db"
+
+
+def profile_slug(name):
+    """Return a file-name-safe key for a profile name ('Jane Doe' -> 'jane-doe')"""
+    slug = re.sub(r"[^a-z0-9_-]+", "-", name.strip().lower()).strip("-")
+    return slug or DEFAULT_PROFILE
+
+
+def profile_path(name, base_dir="."):
+    """Return the progress database path of a profile"""
+    slug = profile_slug(name)
+    if slug == DEFAULT_PROFILE:
+        return os.path.join(base_dir, DEFAULT_PROGRESS_FILE)
+    return os.path.join(base_dir, PROFILE_DIR, slug + ".db")
+
+
+def list_profiles(base_dir="."):
+    """Return the default profile followed by every profile that has a database"""
+    try:
+        names = os.listdir(os.path.join(base_dir, PROFILE_DIR))
+    except FileNotFoundError:
+        names = []
+    slugs = sorted(name[:-3] for name in names if name.endswith(".db"))
+    return [DEFAULT_PROFILE] + [slug for slug in slugs if slug != DEFAULT_PROFILE]
@@ -0,0 +1,304 @@
+# progress.py - Handles progress tracking and persistence
+import json
+import os
+import threading
+import time
+from datetime import datetime
+
+from .attempts import AttemptBuffer, attempt_event, make_attempt
+from .autosave import AutosaveWriter
+from .profiles import DEFAULT_PROFILE, profile_path, profile_slug
+from .review import attempt_quality, sm2_review
+from .rollups import SESSION_RETENTION_DAYS, add_session, retention_cutoff
+from .sqlite_store import SQLiteProgressStore, import_json_progress
+
+# Version 2 keys drug_performance by stable drug ID instead of row position
+PROGRESS_SCHEMA_VERSION = 2
+
+
+def write_json(path, data, indent=2, cancel_event=None):
+    """Write JSON through a temp file and os.replace so readers never see a partial file
+
+    If cancel_event is set while writing, the temp file is removed, path is
+    left untouched and False is returned.
+    """
+    tmp_path = f"{path}.tmp"
+    cancelled = False
+    with open(tmp_path, 'w') as f:
+        for count, chunk in enumerate(json.JSONEncoder(indent=indent).iterencode(data)):
+            if cancel_event is not None and count % 4096 == 0 and cancel_event.is_set():
+                cancelled = True
+                break
+            f.write(chunk)
+    if cancelled:
+        os.remove(tmp_path)
+        return False
+    os.replace(tmp_path, path)
+    return True
+
+
+def positional_key_map(keys, catalog):
+    """Map positional drug keys (row numbers) to the catalog's drug IDs"""
+    return {key: catalog.ids[int(key)] for key in keys if key.isdigit() and int(key) < len(catalog)}
+
+
+def migrate_drug_performance(drug_performance, key_map):
+    """Rekey drug_performance entries through key_map in one pass
+
+    Counters for keys that land on the same drug are summed, and keys
+    missing from the map are kept unchanged.
+    """
+    migrated = {}
+    for key, perf in drug_performance.items():
+        key = key_map.get(key, key)
+
+        existing = migrated.get(key)
+        if existing is None:
+            migrated[key] = {'correct': perf['correct'], 'total': perf['total']}
+        else:
+            existing['correct'] += perf['correct']
+            existing['total'] += perf['total']
+    return migrated
+
+
+def migrate_reviews(reviews, key_map):
+    """Rekey review state through key_map (drug part of each key)"""
+    return {(key_map.get(drug_id, drug_id), qtype): state for (drug_id, qtype), state in reviews.items()}
+
+
+def add_answer(drug_performance, drug_id, is_correct):
+    """Count one scored answer for a drug"""
+    perf = drug_performance.setdefault(drug_id, {'correct': 0, 'total': 0})
+    perf['total'] += 1
+    if is_correct:
+        perf['correct'] += 1
+
+
+def apply_event(progress, event):
+    """Apply one progress event to a progress dict (used live and during replay)"""
+    op = event['op']
+    if op == 'answer':
+        if not event.get('hinted') and not event.get('skipped'):
+            add_answer(progress['drug_performance'], event['drug_id'], event['correct'])
+    elif op == 'stats':
+        progress['total_questions'] += event['total']
+        progress['total_correct'] += event['correct']
+    elif op == 'session':
+        progress['session_history'].append(event['record'])
+        add_session(progress['daily_rollups'], event['record'])
+    elif op == 'review':
+        progress['reviews'][(event['drug_id'], event['qtype'])] = tuple(event['state'])
+    elif op == 'reset':
+        progress.clear()
+        progress.update(empty_progress())
+    elif op == 'migrate':
+        progress['drug_performance'] = migrate_drug_performance(
+            progress['drug_performance'], event['key_map'])
+        progress['reviews'] = migrate_reviews(progress['reviews'], event['key_map'])
+        progress['schema_version'] = event['schema_version']
+    else:
+        raise ValueError(f"Unknown progress event: {op}")
+
+
+def empty_progress():
+    """Return a fresh progress structure"""
+    return {
+        'schema_version': PROGRESS_SCHEMA_VERSION,
+        'total_questions': 0,
+        'total_correct': 0,
+        'session_history': [],
+        'drug_performance': {},
+        'daily_rollups': {},
+        'reviews': {}
+    }
+
+
+class ProgressManager:
+    """Manages study progress and statistics
+    
+    Progress lives in a SQLite database. Changes are recorded as small events:
+    they update the in-memory progress dict immediately and are written to the
+    database in one transaction per save. The progress dict keeps its original
+    shape; session_history is a view that reads persisted sessions on demand
+    and only covers the retention window, while daily_rollups keeps per-day,
+    per-mode totals for every session ever recorded.
+    
+    Saving happens on an autosave thread: pending events are flushed at most
+    every AUTOSAVE_SECONDS or once AUTOSAVE_EVENTS have queued up, so
+    recording an answer never waits on the disk.
+    
+    Individual answers go into a fixed-size AttemptBuffer rather than the
+    event queue and are written in batches alongside it. Each answer also
+    reschedules its (drug, question type) item; see review.py.
+    
+    Each profile has its own database; see profiles.py.
+    """
+    
+    AUTOSAVE_SECONDS = 5.0
+    AUTOSAVE_EVENTS = 25
+    
+    def __init__(self, profile=DEFAULT_PROFILE):
+        self.set_profile(profile)
+        self.session_retention_days = SESSION_RETENTION_DAYS
+        self.progress = {}
+        # Bumped whenever drug_performance changes, so derived tables know to rebuild
+        self.performance_version = 0
+        self.store = None
+        self.autosave = None
+        self.event_seq = 0
+        self.pending_events = []
+        self.attempts = AttemptBuffer()
+        self.events_lock = threading.Lock()
+        self.save_lock = threading.Lock()
+    
+    def set_profile(self, profile):
+        """Point the manager at a profile's database (takes effect on load_progress)"""
+        self.profile = profile_slug(profile)
+        self.progress_file = profile_path(self.profile)
+        # Imported once into the default profile's new database
+        self.legacy_progress_file = "study_progress.json" if self.profile == DEFAULT_PROFILE else None
+    
+    def load_progress(self):
+        """Open the progress database, importing JSON progress the first time"""
+        os.makedirs(os.path.dirname(self.progress_file) or ".", exist_ok=True)
+        self.store = SQLiteProgressStore(self.progress_file)
+        self.store.connect()
+        if (self.store.is_new and self.legacy_progress_file
+                and os.path.exists(self.legacy_progress_file)):
+            import_json_progress(self.legacy_progress_file, self.store, replace=False)
+        self.store.prune_sessions(retention_cutoff(self.session_retention_days))
+        
+        self.progress = self.store.load(PROGRESS_SCHEMA_VERSION)
+        self.performance_version += 1
+        self.pending_events = []
+        
+        self.autosave = AutosaveWriter(self.write_progress, self.AUTOSAVE_SECONDS, self.AUTOSAVE_EVENTS)
+        self.autosave.start()
+    
+    def snapshot(self):
+        """Copy progress so it can be serialized while the original keeps changing"""
+        progress = dict(self.progress)
+        progress['session_history'] = list(self.progress['session_history'])
+        progress['drug_performance'] = {
+            key: dict(perf) for key, perf in self.progress['drug_performance'].items()
+        }
+        progress['daily_rollups'] = {
+            day: {mode: dict(entry) for mode, entry in modes.items()}
+            for day, modes in self.progress['daily_rollups'].items()
+        }
+        return progress
+    
+    def record_event(self, event):
+        """Apply an event now and queue it for the next save"""
+        apply_event(self.progress, event)
+        if event['op'] in ('answer', 'reset', 'migrate'):
+            self.performance_version += 1
+        with self.events_lock:
+            if event['op'] in ('reset', 'migrate'):
+                # Order-sensitive: the (older) buffered attempts must be written first
+                self.spill_attempts()
+            self.event_seq += 1
+            event['seq'] = self.event_seq
+            self.pending_events.append(event)
+        if self.autosave is not None:
+            self.autosave.mark_dirty()
+    
+    def record_attempt(self, drug_id, qtype, is_correct, response_ms=None, hinted=False, skipped=False):
+        """Log one attempt; revealed or skipped questions do not change the drug's score"""
+        attempt = make_attempt(datetime.now().isoformat(), drug_id, qtype, is_correct,
+                               response_ms, hinted, skipped)
+        if not hinted and not skipped:
+            add_answer(self.progress['drug_performance'], drug_id, is_correct)
+            self.performance_version += 1
+        with self.events_lock:
+            if self.attempts.append(attempt):
+                self.spill_attempts()
+        self.record_review(drug_id, qtype, attempt_quality(is_correct, response_ms, hinted, skipped))
+    
+    def record_review(self, drug_id, qtype, quality):
+        """Reschedule one (drug, question type) item after a graded review"""
+        state = sm2_review(self.progress['reviews'].get((drug_id, qtype)), quality, time.time())
+        self.record_event({'op': 'review', 'drug_id': drug_id, 'qtype': qtype, 'state': state})
+    
+    def spill_attempts(self):
+        """Move buffered attempts onto the event queue (called with events_lock held)"""
+        for attempt in self.attempts.drain():
+            self.event_seq += 1
+            event = attempt_event(attempt)
+            event['seq'] = self.event_seq
+            self.pending_events.append(event)
+    
+    def save_progress(self):
+        """Ask the autosave thread to write pending events now"""
+        if self.autosave is not None:
+            self.autosave.request_flush()
+        else:
+            self.write_progress()
+    
+    def close(self):
+        """Flush pending events and stop the autosave thread"""
+        if self.autosave is not None:
+            self.autosave.stop()
+            self.autosave = None
+        if self.store is not None:
+            self.write_progress()
+            self.store.close()
+            self.store = None
+    
+    def write_progress(self):
+        """Write every queued event and buffered attempt in one transaction
+        
+        Both are taken while holding save_lock, so batches reach the database
+        in the order they were recorded (buffered attempts are always newer
+        than the queued events).
+        """
+        with self.save_lock:
+            with self.events_lock:
+                events, self.pending_events = self.pending_events, []
+                attempts = self.attempts.drain()
+            try:
+                self.store.append(events, attempts)
+            except Exception as e:
+                # The failed transaction was rolled back; retry these next time
+                with self.events_lock:
+                    self.pending_events[:0] = events + [attempt_event(attempt) for attempt in attempts]
+                print(f"Failed to save progress: {str(e)}")
+    
+    def switch_profile(self, profile):
+        """Save and close the current profile, then load another one"""
+        self.close()
+        self.set_profile(profile)
+        self.load_progress()
+    
+    def reset_progress(self):
+        """Clear all progress data and save"""
+        self.record_event({'op': 'reset', 'schema_version': PROGRESS_SCHEMA_VERSION})
+        self.save_progress()
+    
+    def migrate_drug_ids(self, catalog):
+        """Upgrade positional drug keys to stable IDs and rewrite the stored counters"""
+        if self.progress.get('schema_version', 1) >= PROGRESS_SCHEMA_VERSION:
+            return
+        
+        self.record_event({
+            'op': 'migrate',
+            'schema_version': PROGRESS_SCHEMA_VERSION,
+            'key_map': positional_key_map(self.progress['drug_performance'], catalog),
+        })
+        self.save_progress()
+    
+    def update_session_stats(self, session_correct, session_total):
+        """Update overall session statistics"""
+        self.record_event({'op': 'stats', 'correct': session_correct, 'total': session_total})
+    
+    def record_session(self, mode, session_correct, session_total):
+        """Record a completed session"""
+        session_record = {
+            'date': datetime.now().isoformat(),
+            'mode': mode,
+            'total': session_total,
+            'correct': session_correct,
+            'accuracy': (session_correct / max(session_total, 1)) * 100
+        }
+        self.record_event({'op': 'session', 'record': session_record})
+        self.save_progress()
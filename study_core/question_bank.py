@@ -0,0 +1,73 @@
+# question_bank.py - Vectorized builder for the full question bank (imports numpy)
+from .questions import QUESTION_TYPES, question_dict, question_type_name
+
+
+class QuestionBank:
+    """Every valid (drug, template) question as parallel numpy arrays
+
+    Arrays: rows (catalog row), drug_ids, type_codes (index into
+    question_types), prompts and answers. Questions are grouped by type, in
+    catalog order within each type.
+    """
+
+    def __init__(self, arrays, question_types):
+        self.arrays = arrays
+        self.question_types = question_types
+        self.type_names = [question_type_name(question_type) for question_type in question_types]
+
+    def __len__(self):
+        return len(self.arrays['rows'])
+
+    def __getitem__(self, name):
+        return self.arrays[name]
+
+    def question(self, i):
+        """Return question i as the dict shape used by Q&A practice"""
+        return question_dict(self.question_types[self.arrays['type_codes'][i]], self.arrays['prompts'][i],
+                             self.arrays['answers'][i], int(self.arrays['rows'][i]), self.arrays['drug_ids'][i])
+
+    def to_dataframe(self):
+        """Return the bank as a DataFrame with a readable type column (imports pandas)"""
+        import pandas as pd
+        df = pd.DataFrame(self.arrays)
+        df['type'] = pd.Categorical.from_codes(df['type_codes'], self.type_names)
+        return df
+
+
+def build_question_bank(catalog, indices=None, question_types=QUESTION_TYPES):
+    """Build every valid question for the given rows (default: all) column-wise
+
+    Each template is handled as a whole: a validity mask over its question
+    and answer columns, one fancy-index per column, and the prompt formed by
+    concatenating the template's prefix and suffix onto the value array.
+    No Python-level loop runs per drug.
+    """
+    import numpy as np
+
+    rows = np.arange(len(catalog)) if indices is None else np.asarray(indices, dtype=np.int64)
+    column_cache = {}
+
+    def column(name):
+        # Object arrays of the selected rows plus their non-empty mask, built once per column
+        if name not in column_cache:
+            values = np.array(catalog.columns[name], dtype=object)[rows]
+            column_cache[name] = (values, values.astype(bool))
+        return column_cache[name]
+
+    ids = np.array(catalog.ids, dtype=object)[rows]
+    parts = {'rows': [], 'drug_ids': [], 'type_codes': [], 'prompts': [], 'answers': []}
+    for code, (q_col, a_col, template) in enumerate(question_types):
+        q_values, q_valid = column(q_col)
+        a_values, a_valid = column(a_col)
+        valid = q_valid & a_valid
+        prefix, suffix = template.split("{}")
+
+        parts['rows'].append(rows[valid])
+        parts['drug_ids'].append(ids[valid])
+        parts['type_codes'].append(np.full(int(valid.sum()), code, dtype=np.int8))
+        parts['prompts'].append(prefix + q_values[valid] + suffix)
+        parts['answers'].append(a_values[valid])
+
+    arrays = {name: np.concatenate(chunks) if chunks else np.array([], dtype=object)
+              for name, chunks in parts.items()}
+    return QuestionBank(arrays, question_types)
@@ -0,0 +1,103 @@
+# questions.py - Q&A question generation
+import random
+
+# (question column, answer column, template)
+QUESTION_TYPES = [
+    ("Generic Name", "Brand Name(s)", "What is the brand name for {}?"),
+    ("Brand Name(s)", "Generic Name", "What is the generic name for {}?"),
+    ("Generic Name", "Drug Class", "What drug class does {} belong to?"),
+    ("Generic Name", "Indication", "What is {} used for?"),
+    ("Generic Name", "Side Effects", "What are the main side effects of {}?"),
+    ("Drug Class", "Generic Name", "Name a drug from the {} class:"),
+]
+# Columns that typed answers are checked against
+ANSWER_FIELDS = tuple(dict.fromkeys(a_col for _, a_col, _ in QUESTION_TYPES))
+
+
+class SparsePermutation:
+    """Lazy uniformly random permutation of range(n) (sparse Fisher-Yates)
+
+    Only positions that have been swapped are stored, so drawing k values
+    costs O(k) time and memory regardless of n.
+    """
+
+    def __init__(self, n, rng=random):
+        self.n = n
+        self.rng = rng
+        self.position = 0
+        self.swapped = {}
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        i = self.position
+        if i >= self.n:
+            raise StopIteration
+        j = self.rng.randrange(i, self.n)
+        value = self.swapped.get(j, j)
+        # Position i is never read again; j takes over whatever was at i
+        self.swapped[j] = self.swapped.pop(i, i)
+        self.position = i + 1
+        return value
+
+
+def question_type_name(question_type):
+    """Return the 'type' string used in question dicts, e.g. 'Generic Name_to_Drug Class'"""
+    q_col, a_col, _ = question_type
+    return f"{q_col}_to_{a_col}"
+
+
+def question_dict(question_type, prompt, answer, idx, drug_id):
+    """The question dict shape used by Q&A practice"""
+    q_col, a_col, _ = question_type
+    return {
+        'question': prompt,
+        'correct_answer': answer,
+        'drug_index': idx,
+        'drug_id': drug_id,
+        'type': question_type_name(question_type),
+        'question_field': q_col,
+        'answer_field': a_col
+    }
+
+
+def make_question(catalog, idx, question_type):
+    """Return the question dict for one (drug, template) pair, or None if a value is missing"""
+    q_col, a_col, q_template = question_type
+    q_value = catalog.columns[q_col][idx]
+    a_value = catalog.columns[a_col][idx]
+    if not (q_value and a_value):
+        return None
+    return question_dict(question_type, q_template.format(q_value), a_value, idx, catalog.ids[idx])
+
+
+def iter_questions(catalog, indices, rng=random):
+    """Yield questions for a sequence of rows in random order, one at a time
+
+    Walks a lazy permutation of every (drug, template) pair, skipping pairs
+    with a missing value, so the first question costs O(1) and memory grows
+    only with the questions actually drawn.
+    """
+    num_types = len(QUESTION_TYPES)
+    for pair in SparsePermutation(len(indices) * num_types, rng):
+        row, type_index = divmod(pair, num_types)
+        question = make_question(catalog, indices[row], QUESTION_TYPES[type_index])
+        if question is not None:
+            yield question
+
+
+def generate_questions(catalog, indices, rng=random):
+    """Generate the full shuffled question bank for the given catalog rows
+
+    Practice sessions draw from iter_questions instead.
+    """
+    questions = []
+    for idx in indices:
+        for question_type in QUESTION_TYPES:
+            question = make_question(catalog, idx, question_type)
+            if question is not None:
+                questions.append(question)
+
+    rng.shuffle(questions)
+    return questions
@@ -0,0 +1,129 @@
+# review.py - SM-2 spaced repetition per (drug, question type) and a due-time heap per session
+import heapq
+import itertools
+import random
+import time
+
+from .questions import QUESTION_TYPES, make_question
+
+# Review state tuple: (ease, interval in days, repetitions, due as epoch seconds)
+EASE, INTERVAL, REPETITIONS, DUE = range(4)
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+DAY_SECONDS = 86400
+# A failed item comes back this soon, so it is retried within the same sitting
+RELEARN_SECONDS = 600
+# Correct answers faster than this count as effortless recall
+FAST_RESPONSE_MS = 4000
+# Unseen items mixed into one due-review session
+NEW_ITEMS_PER_SESSION = 20
+# Learn mode schedules each drug's flashcard as its own item
+FLASHCARD_QTYPE = 'flashcard'
+
+
+def attempt_quality(is_correct, response_ms=None, hinted=False, skipped=False):
+    """SM-2 grade (0-5) for a Q&A attempt"""
+    if hinted:
+        return 0
+    if skipped:
+        return 1
+    if not is_correct:
+        return 2
+    if response_ms is not None and response_ms < FAST_RESPONSE_MS:
+        return 5
+    return 4
+
+
+def sm2_review(state, quality, now):
+    """Return the review state after answering with the given grade
+
+    Ease moves by the SM-2 formula on every review. A grade below 3 resets
+    the repetitions and brings the item back after RELEARN_SECONDS;
+    otherwise the interval grows 1 day, 6 days, then by the ease factor.
+    """
+    ease, interval, repetitions, _ = state or (DEFAULT_EASE, 0, 0, now)
+    miss = 5 - quality
+    ease = max(MIN_EASE, ease + 0.1 - miss * (0.08 + miss * 0.02))
+    if quality < 3:
+        return (ease, 0, 0, now + RELEARN_SECONDS)
+
+    repetitions += 1
+    if repetitions == 1:
+        interval = 1
+    elif repetitions == 2:
+        interval = 6
+    else:
+        interval = round(interval * ease, 1)
+    return (ease, interval, repetitions, now + interval * DAY_SECONDS)
+
+
+class ReviewQueue:
+    """Min-heap of one session's items ordered by due time
+
+    Iterating yields keys that are due now: overdue items first, harder
+    (lower ease) items first among equal due times, then up to new_limit
+    unseen items in random order. Each step is O(log n). When the next key is
+    requested, the previous one is pushed back with its updated due time if
+    it was reviewed, so failed items return after RELEARN_SECONDS. Iteration
+    stops when nothing left is due.
+    """
+
+    def __init__(self, reviews, keys, new_limit=NEW_ITEMS_PER_SESSION, rng=random, clock=time.time):
+        self.reviews = reviews
+        self.clock = clock
+        self.counter = itertools.count()
+        self.last = None
+
+        heap = []
+        unseen = []
+        for key in keys:
+            state = reviews.get(key)
+            if state is None:
+                unseen.append(key)
+            else:
+                heap.append(self.entry(key, state))
+        now = clock()
+        for key in rng.sample(unseen, min(new_limit, len(unseen))):
+            heap.append((now, DEFAULT_EASE, next(self.counter), key))
+        heapq.heapify(heap)
+        self.heap = heap
+
+    def entry(self, key, state):
+        return (state[DUE], state[EASE], next(self.counter), key)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.last is not None:
+            key, state = self.last
+            self.last = None
+            current = self.reviews.get(key)
+            if current is not None and current != state:
+                heapq.heappush(self.heap, self.entry(key, current))
+
+        if not self.heap or self.heap[0][0] > self.clock():
+            raise StopIteration
+        key = heapq.heappop(self.heap)[3]
+        self.last = (key, self.reviews.get(key))
+        return key
+
+
+def review_questions(catalog, indices, reviews, new_limit=NEW_ITEMS_PER_SESSION, rng=random):
+    """Yield due questions for the given rows, most overdue first (see ReviewQueue)"""
+    columns = catalog.columns
+    pairs = {}
+    for idx in indices:
+        for question_type in QUESTION_TYPES:
+            q_col, a_col, _ = question_type
+            if columns[q_col][idx] and columns[a_col][idx]:
+                pairs[(catalog.ids[idx], f"{q_col}_to_{a_col}")] = (idx, question_type)
+
+    for key in ReviewQueue(reviews, pairs, new_limit, rng):
+        yield make_question(catalog, *pairs[key])
+
+
+def review_cards(catalog, indices, reviews, new_limit=NEW_ITEMS_PER_SESSION, rng=random):
+    """Return the rows whose flashcards are due now, most overdue first"""
+    rows = {(catalog.ids[idx], FLASHCARD_QTYPE): idx for idx in indices}
+    return [rows[key] for key in ReviewQueue(reviews, rows, new_limit, rng)]
@@ -0,0 +1,66 @@
+# rollups.py - Per-day, per-mode session aggregates
+from datetime import date, timedelta
+
+# Raw sessions older than this are dropped; their counts live on in the rollups
+SESSION_RETENTION_DAYS = 90
+
+
+def session_day(record):
+    """Return the YYYY-MM-DD day of a session record"""
+    return record['date'][:10]
+
+
+def add_session(rollups, record):
+    """Fold one session record into {day: {mode: {'sessions', 'correct', 'total'}}}"""
+    modes = rollups.setdefault(session_day(record), {})
+    entry = modes.setdefault(record['mode'], {'sessions': 0, 'correct': 0, 'total': 0})
+    entry['sessions'] += 1
+    entry['correct'] += record['correct']
+    entry['total'] += record['total']
+
+
+def build_rollups(records):
+    """Return rollups for an iterable of session records"""
+    rollups = {}
+    for record in records:
+        add_session(rollups, record)
+    return rollups
+
+
+def rollup_totals(rollups, since=None, mode=None):
+    """Sum sessions/correct/total over days >= since (a YYYY-MM-DD string), optionally one mode"""
+    totals = {'sessions': 0, 'correct': 0, 'total': 0}
+    for day, modes in rollups.items():
+        if since is not None and day < since:
+            continue
+        for entry_mode, entry in modes.items():
+            if mode is not None and entry_mode != mode:
+                continue
+            for key in totals:
+                totals[key] += entry[key]
+    return totals
+
+
+def weekly_rollups(rollups):
+    """Regroup daily rollups by ISO week: {'YYYY-Www': {mode: totals}}"""
+    weeks = {}
+    for day, modes in rollups.items():
+        year, week, _ = date.fromisoformat(day).isocalendar()
+        week_modes = weeks.setdefault(f"{year}-W{week:02d}", {})
+        for mode, entry in modes.items():
+            target = week_modes.setdefault(mode, {'sessions': 0, 'correct': 0, 'total': 0})
+            for key in target:
+                target[key] += entry[key]
+    return weeks
+
+
+def week_start(today=None):
+    """Return the Monday of the current week as YYYY-MM-DD"""
+    today = today or date.today()
+    return (today - timedelta(days=today.weekday())).isoformat()
+
+
+def retention_cutoff(days=SESSION_RETENTION_DAYS, today=None):
+    """Return the first day (YYYY-MM-DD) whose raw sessions are kept"""
+    today = today or date.today()
+    return (today - timedelta(days=days)).isoformat()
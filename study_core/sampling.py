@@ -0,0 +1,92 @@
+# sampling.py - Weighted card sampling with a Walker alias table
+import random
+from collections.abc import Sequence
+
+
+def weakness_weights(drug_ids, drug_performance):
+    """Laplace-smoothed error rate per drug: (wrong + 1) / (answered + 2)
+
+    Unseen drugs get 0.5, and no drug ever reaches zero weight, so mastered
+    cards still come up now and then.
+    """
+    weights = []
+    for drug_id in drug_ids:
+        perf = drug_performance.get(drug_id)
+        if perf is None:
+            weights.append(0.5)
+        else:
+            weights.append((perf['total'] - perf['correct'] + 1) / (perf['total'] + 2))
+    return weights
+
+
+class AliasTable:
+    """Walker alias table (Vose's construction): O(n) build, O(1) draws
+
+    Each slot i keeps the probability of returning i itself and an alias to
+    return otherwise, so a draw is one random number and one comparison no
+    matter how many weights there are.
+    """
+
+    def __init__(self, weights):
+        n = len(weights)
+        total = float(sum(weights))
+        if n == 0 or total <= 0:
+            raise ValueError("alias table needs at least one positive weight")
+
+        scaled = [weight * n / total for weight in weights]
+        probability = [1.0] * n
+        alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            probability[less] = scaled[less]
+            alias[less] = more
+            scaled[more] += scaled[less] - 1.0
+            (small if scaled[more] < 1.0 else large).append(more)
+        # Whatever is left is 1.0 up to rounding error
+
+        self.probability = probability
+        self.alias = alias
+
+    def __len__(self):
+        return len(self.probability)
+
+    def sample(self, rng=random):
+        """Draw one index with probability proportional to its weight"""
+        u = rng.random() * len(self.probability)
+        i = int(u)
+        return i if u - i < self.probability[i] else self.alias[i]
+
+
+class SampledDeck(Sequence):
+    """A fixed-length deck drawn with replacement from an alias table, one card at a time
+
+    Cards are drawn when first indexed and then kept, so going back shows
+    the same card. make(position) turns a table index into a card.
+    """
+
+    def __init__(self, table, size, make, rng=random):
+        self.table = table
+        self.size = size
+        self.make = make
+        self.rng = rng
+        self.cards = []
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.size))]
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("deck index out of range")
+        while len(self.cards) <= index:
+            self.cards.append(self.make(self.table.sample(self.rng)))
+        return self.cards[index]
+
+    def redraw(self):
+        """Forget the drawn cards so the deck is sampled afresh"""
+        self.cards = []
@@ -0,0 +1,68 @@
+# selection.py - Tk-free drug/section selection state
+from itertools import compress
+
+
+class SelectionModel:
+    """Stores drug selection as a byte mask plus one flag per section
+
+    A drug counts as selected when both its own bit and its section flag are
+    set, matching the behaviour of the old per-row BooleanVars.
+    """
+
+    def __init__(self, num_rows, section_index):
+        self.num_rows = num_rows
+        self.section_index = section_index
+        self.drug_mask = bytearray(b"\x01") * num_rows
+        self.section_flags = dict.fromkeys(section_index, True)
+        self.version = 0
+        self._cached_version = None
+        self._cached_indices = []
+
+    def _changed(self):
+        self.version += 1
+
+    def is_drug_selected(self, idx):
+        """Return the drug's own selection bit"""
+        return bool(self.drug_mask[idx])
+
+    def set_drug(self, idx, value):
+        """Select or deselect a single drug"""
+        self.drug_mask[idx] = 1 if value else 0
+        self._changed()
+
+    def is_section_selected(self, section_name):
+        """Return whether a section is included"""
+        return self.section_flags[section_name]
+
+    def set_section(self, section_name, value):
+        """Include or exclude a section and set every drug in it to match"""
+        self.section_flags[section_name] = bool(value)
+        fill = b"\x01" if value else b"\x00"
+        for start, stop in self.section_index[section_name]:
+            self.drug_mask[start:stop] = fill * (stop - start)
+        self._changed()
+
+    def set_all(self, value):
+        """Select or deselect every drug and section"""
+        for section_name in self.section_flags:
+            self.section_flags[section_name] = bool(value)
+        self.drug_mask[:] = (b"\x01" if value else b"\x00") * self.num_rows
+        self._changed()
+
+    def selected_indices(self):
+        """Return the sorted row positions of all selected drugs"""
+        if self._cached_version != self.version:
+            indices = []
+            mask = self.drug_mask
+            for section_name, ranges in self.section_index.items():
+                if self.section_flags[section_name]:
+                    for start, stop in ranges:
+                        indices.extend(compress(range(start, stop), mask[start:stop]))
+            indices.sort()
+            self._cached_indices = indices
+            self._cached_version = self.version
+        return self._cached_indices
+
+    def count(self):
+        """Return the number of selected drugs"""
+        return len(self.selected_indices())
@@ -0,0 +1,413 @@
+# sqlite_store.py - SQLite-backed progress storage with indexed session and attempt tables
+import json
+import os
+import threading
+from collections.abc import Sequence
+from contextlib import contextmanager
+
+from .attempts import ATTEMPT_FIELDS, counts_toward_score, event_attempt
+from .filelock import FileLock
+from .rollups import build_rollups, session_day
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    date TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    correct INTEGER NOT NULL,
+    accuracy REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_date ON sessions(date);
+CREATE INDEX IF NOT EXISTS sessions_mode_date ON sessions(mode, date);
+CREATE TABLE IF NOT EXISTS attempts (
+    id INTEGER PRIMARY KEY,
+    date TEXT NOT NULL,
+    drug_id TEXT NOT NULL,
+    correct INTEGER NOT NULL,
+    qtype TEXT,
+    response_ms INTEGER,
+    hinted INTEGER NOT NULL DEFAULT 0,
+    skipped INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS attempts_drug_date ON attempts(drug_id, date);
+CREATE INDEX IF NOT EXISTS attempts_date ON attempts(date);
+CREATE TABLE IF NOT EXISTS drug_stats (
+    drug_id TEXT PRIMARY KEY,
+    correct INTEGER NOT NULL,
+    total INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS session_rollups (
+    day TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    sessions INTEGER NOT NULL,
+    correct INTEGER NOT NULL,
+    total INTEGER NOT NULL,
+    PRIMARY KEY (day, mode)
+);
+CREATE TABLE IF NOT EXISTS review_state (
+    drug_id TEXT NOT NULL,
+    qtype TEXT NOT NULL,
+    ease REAL NOT NULL,
+    interval REAL NOT NULL,
+    repetitions INTEGER NOT NULL,
+    due REAL NOT NULL,
+    PRIMARY KEY (drug_id, qtype)
+);
+INSERT OR IGNORE INTO meta (key, value) VALUES ('total_questions', '0'), ('total_correct', '0');
+"""
+
+SESSION_COLUMNS = ('date', 'mode', 'total', 'correct', 'accuracy')
+PROGRESS_TABLES = ('sessions', 'attempts', 'drug_stats', 'session_rollups', 'review_state')
+# Columns added to attempts after its first release
+ATTEMPT_COLUMNS_ADDED = (
+    ('qtype', 'TEXT'),
+    ('response_ms', 'INTEGER'),
+    ('hinted', 'INTEGER NOT NULL DEFAULT 0'),
+    ('skipped', 'INTEGER NOT NULL DEFAULT 0'),
+)
+
+
+class SessionHistory(Sequence):
+    """session_history facade: rows persisted at load are read on demand from SQLite
+
+    Sessions recorded since load are kept in memory, so the view never depends
+    on whether a background write has landed yet. Slices near the end (the
+    common [-15:]) are read newest-first, so they cost O(slice), not O(history).
+    """
+
+    def __init__(self, store, persisted_count, max_id):
+        self.store = store
+        self.persisted_count = persisted_count
+        self.max_id = max_id
+        self.appended = []
+
+    def __len__(self):
+        return self.persisted_count + len(self.appended)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            stop = max(start, stop)
+            rows = []
+            if start < self.persisted_count:
+                rows = self.store.read_sessions(start, min(stop, self.persisted_count),
+                                                self.persisted_count, self.max_id)
+            offset = self.persisted_count
+            return rows + self.appended[max(start - offset, 0):max(stop - offset, 0)]
+
+        size = len(self)
+        index = key + size if key < 0 else key
+        if not 0 <= index < size:
+            raise IndexError("session index out of range")
+        return self[index:index + 1][0]
+
+    def __iter__(self):
+        if self.persisted_count:
+            yield from self.store.iter_sessions(self.max_id)
+        yield from self.appended
+
+    def append(self, record):
+        self.appended.append(record)
+
+
+# Mounts where SQLite's WAL mode cannot work: it needs shared memory on one host
+NETWORK_FILESYSTEMS = frozenset({"nfs", "nfs4", "cifs", "smbfs", "smb3", "9p", "afs", "fuse.sshfs"})
+# GetDriveTypeW result for a mapped network drive
+DRIVE_REMOTE = 4
+
+
+def on_network_drive(path):
+    """True if path is on a network share (UNC path or mapped drive on Windows, a network mount in /proc/mounts)"""
+    path = os.path.realpath(path)
+    if os.name == 'nt':
+        import ctypes
+
+        drive = os.path.splitdrive(path)[0]
+        if drive.startswith("\\\\"):
+            return True
+        return ctypes.windll.kernel32.GetDriveTypeW(drive + "\\") == DRIVE_REMOTE
+    try:
+        with open("/proc/mounts", encoding="utf-8") as f:
+            mounts = [line.split()[1:3] for line in f]
+    except OSError:
+        return False
+    mount_point, fstype = "", None
+    for point, kind in mounts:
+        point = point.replace("\\040", " ")
+        if (path == point or path.startswith(point.rstrip("/") + "/")) and len(point) > len(mount_point):
+            mount_point, fstype = point, kind
+    return fstype in NETWORK_FILESYSTEMS
+
+
+class SQLiteProgressStore:
+    """Progress tables in one SQLite file
+
+    Writes go through append(events), one transaction per batch, on a
+    dedicated writer connection; the session view reads on its own
+    connection. WAL mode lets the two proceed without blocking each other.
+    WAL needs shared memory on one host, so a file on a network share uses
+    the rollback journal instead, and readers and the writer take turns.
+
+    Several processes may share a file: every write transaction holds a
+    cross-process FileLock, and writes are increments (counters, totals,
+    rollups) or appends (sessions, attempts), so concurrent writers merge
+    instead of overwriting each other. Review state is the exception: each
+    (drug, question type) row holds the latest review, whichever process
+    wrote it.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.is_new = not os.path.exists(path)
+        self.reader = None
+        self.writer = None
+        self.write_lock = threading.Lock()
+        self.file_lock = FileLock(path + ".lock")
+
+    def connect(self):
+        """Open (and create if needed) the database"""
+        import sqlite3
+
+        # Other processes may hold the database briefly; wait for them instead of failing
+        self.writer = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        journal_mode = "DELETE" if on_network_drive(self.path) else "WAL"
+        with self.write_lock, self.file_lock:
+            self.writer.execute(f"PRAGMA journal_mode={journal_mode}")
+            self.writer.executescript(SCHEMA)
+        self.writer.execute("PRAGMA synchronous=NORMAL")
+        self.reader = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        with self.write_transaction():
+            self.upgrade_attempts()
+            self.backfill_rollups()
+
+    @contextmanager
+    def write_transaction(self):
+        """One write transaction, exclusive within this process and across processes"""
+        with self.write_lock, self.file_lock, self.writer:
+            self.writer.execute("BEGIN IMMEDIATE")
+            yield self.writer
+
+    def upgrade_attempts(self):
+        """Add attempt columns missing from databases created by older versions"""
+        existing = {row[1] for row in self.writer.execute("PRAGMA table_info(attempts)")}
+        for name, declaration in ATTEMPT_COLUMNS_ADDED:
+            if name not in existing:
+                self.writer.execute(f"ALTER TABLE attempts ADD COLUMN {name} {declaration}")
+
+    def backfill_rollups(self):
+        """Build rollups once for databases written before they existed"""
+        if self.writer.execute("SELECT 1 FROM meta WHERE key = 'session_rollups'").fetchone():
+            return
+        self.writer.execute("DELETE FROM session_rollups")
+        self.writer.execute(
+            "INSERT INTO session_rollups (day, mode, sessions, correct, total) "
+            "SELECT substr(date, 1, 10), mode, COUNT(*), SUM(correct), SUM(total) "
+            "FROM sessions GROUP BY 1, 2")
+        self.set_meta({'session_rollups': 1})
+
+    def prune_sessions(self, cutoff_day):
+        """Delete raw sessions before cutoff_day (YYYY-MM-DD); rollups keep their counts"""
+        with self.write_transaction():
+            return self.writer.execute("DELETE FROM sessions WHERE date < ?", (cutoff_day,)).rowcount
+
+    def close(self):
+        for conn in (self.reader, self.writer):
+            if conn is not None:
+                conn.close()
+        self.reader = self.writer = None
+
+    def read_meta(self):
+        return {key: json.loads(value) for key, value in self.reader.execute("SELECT key, value FROM meta")}
+
+    def load(self, default_schema_version):
+        """Return the progress facade dict
+
+        Counters and daily rollups are loaded into memory (they are bounded by
+        the catalog size and the days of use); raw session history stays in
+        the database behind a SessionHistory view.
+        """
+        meta = self.read_meta()
+        count, max_id = self.reader.execute("SELECT COUNT(*), COALESCE(MAX(id), 0) FROM sessions").fetchone()
+        progress = {
+            'schema_version': meta.get('schema_version', default_schema_version),
+            'total_questions': meta.get('total_questions', 0),
+            'total_correct': meta.get('total_correct', 0),
+            'session_history': SessionHistory(self, count, max_id),
+            'drug_performance': {
+                drug_id: {'correct': correct, 'total': total}
+                for drug_id, correct, total in self.reader.execute(
+                    "SELECT drug_id, correct, total FROM drug_stats")
+            },
+            'daily_rollups': self.read_rollups(),
+            'reviews': self.read_reviews(),
+        }
+        return progress
+
+    def read_rollups(self):
+        rollups = {}
+        for day, mode, sessions, correct, total in self.reader.execute(
+                "SELECT day, mode, sessions, correct, total FROM session_rollups"):
+            rollups.setdefault(day, {})[mode] = {'sessions': sessions, 'correct': correct, 'total': total}
+        return rollups
+
+    def read_reviews(self):
+        """(drug_id, qtype) -> (ease, interval, repetitions, due)"""
+        return {(drug_id, qtype): (ease, interval, repetitions, due)
+                for drug_id, qtype, ease, interval, repetitions, due in self.reader.execute(
+                    "SELECT drug_id, qtype, ease, interval, repetitions, due FROM review_state")}
+
+    def read_sessions(self, start, stop, count, max_id):
+        """Return persisted sessions [start, stop) of the first count rows (ids <= max_id)"""
+        if stop <= start:
+            return []
+        columns = ", ".join(SESSION_COLUMNS)
+        if start >= count - stop:
+            # Closer to the end: walk the id index backwards
+            cursor = self.reader.execute(
+                f"SELECT {columns} FROM sessions WHERE id <= ? ORDER BY id DESC LIMIT ? OFFSET ?",
+                (max_id, stop - start, count - stop))
+            rows = cursor.fetchall()
+            rows.reverse()
+        else:
+            cursor = self.reader.execute(
+                f"SELECT {columns} FROM sessions WHERE id <= ? ORDER BY id LIMIT ? OFFSET ?",
+                (max_id, stop - start, start))
+            rows = cursor.fetchall()
+        return [dict(zip(SESSION_COLUMNS, row)) for row in rows]
+
+    def iter_sessions(self, max_id):
+        """Yield every persisted session up to max_id in order"""
+        columns = ", ".join(SESSION_COLUMNS)
+        cursor = self.reader.execute(
+            f"SELECT {columns} FROM sessions WHERE id <= ? ORDER BY id", (max_id,))
+        for row in cursor:
+            yield dict(zip(SESSION_COLUMNS, row))
+
+    def append(self, events, attempts=()):
+        """Apply a batch of progress events, then attempt tuples, in one transaction"""
+        if not events and not attempts:
+            return
+        with self.write_transaction():
+            for event in events:
+                self.write_event(event)
+            self.insert_attempts(attempts)
+
+    def insert_attempts(self, attempts):
+        """Log attempts and bump the per-drug counters for the scored ones"""
+        if not attempts:
+            return
+        self.writer.executemany(
+            f"INSERT INTO attempts ({', '.join(ATTEMPT_FIELDS)}) VALUES (?, ?, ?, ?, ?, ?, ?)", attempts)
+        self.writer.executemany(
+            "INSERT INTO drug_stats (drug_id, correct, total) VALUES (?, ?, 1) "
+            "ON CONFLICT(drug_id) DO UPDATE SET correct = correct + excluded.correct, "
+            "total = total + 1",
+            [(attempt[1], attempt[3]) for attempt in attempts if counts_toward_score(attempt)])
+
+    def write_event(self, event):
+        op = event['op']
+        db = self.writer
+        if op == 'answer':
+            self.insert_attempts([event_attempt(event)])
+        elif op == 'stats':
+            db.execute("UPDATE meta SET value = value + ? WHERE key = 'total_questions'", (event['total'],))
+            db.execute("UPDATE meta SET value = value + ? WHERE key = 'total_correct'", (event['correct'],))
+        elif op == 'session':
+            record = event['record']
+            db.execute(f"INSERT INTO sessions ({', '.join(SESSION_COLUMNS)}) VALUES (?, ?, ?, ?, ?)",
+                       tuple(record[column] for column in SESSION_COLUMNS))
+            db.execute("INSERT INTO session_rollups (day, mode, sessions, correct, total) "
+                       "VALUES (?, ?, 1, ?, ?) ON CONFLICT(day, mode) DO UPDATE SET "
+                       "sessions = sessions + 1, correct = correct + excluded.correct, "
+                       "total = total + excluded.total",
+                       (session_day(record), record['mode'], record['correct'], record['total']))
+        elif op == 'review':
+            db.execute("INSERT OR REPLACE INTO review_state "
+                       "(drug_id, qtype, ease, interval, repetitions, due) VALUES (?, ?, ?, ?, ?, ?)",
+                       (event['drug_id'], event['qtype'], *event['state']))
+        elif op == 'reset':
+            for table in PROGRESS_TABLES:
+                db.execute(f"DELETE FROM {table}")
+            self.set_meta({'schema_version': event['schema_version'],
+                           'total_questions': 0, 'total_correct': 0})
+        elif op == 'migrate':
+            # Fold old keys into new ones in SQL so counts written by other processes survive
+            for old_key, new_key in event['key_map'].items():
+                db.execute("INSERT INTO drug_stats (drug_id, correct, total) "
+                           "SELECT ?, correct, total FROM drug_stats WHERE drug_id = ? "
+                           "ON CONFLICT(drug_id) DO UPDATE SET correct = correct + excluded.correct, "
+                           "total = total + excluded.total", (new_key, old_key))
+                db.execute("DELETE FROM drug_stats WHERE drug_id = ?", (old_key,))
+                db.execute("UPDATE OR REPLACE review_state SET drug_id = ? WHERE drug_id = ?",
+                           (new_key, old_key))
+            self.set_meta({'schema_version': event['schema_version']})
+        else:
+            raise ValueError(f"Unknown progress event: {op}")
+
+    def set_meta(self, values):
+        self.writer.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                                [(key, json.dumps(value)) for key, value in values.items()])
+
+    def insert_drug_stats(self, drug_performance):
+        self.writer.executemany(
+            "INSERT INTO drug_stats (drug_id, correct, total) VALUES (?, ?, ?)",
+            [(drug_id, perf['correct'], perf['total']) for drug_id, perf in drug_performance.items()])
+
+    def import_progress(self, progress, replace=True):
+        """Bulk-load a plain progress dict (as stored in the JSON format)
+
+        With replace=False the import is skipped (returning False) if any
+        process has already imported into this database.
+        """
+        with self.write_transaction():
+            if not replace and self.writer.execute(
+                    "SELECT 1 FROM meta WHERE key = 'imported'").fetchone():
+                return False
+            for table in PROGRESS_TABLES:
+                self.writer.execute(f"DELETE FROM {table}")
+            self.writer.executemany(
+                f"INSERT INTO sessions ({', '.join(SESSION_COLUMNS)}) VALUES (?, ?, ?, ?, ?)",
+                [tuple(record[column] for column in SESSION_COLUMNS)
+                 for record in progress['session_history']])
+            self.writer.executemany(
+                "INSERT INTO session_rollups (day, mode, sessions, correct, total) VALUES (?, ?, ?, ?, ?)",
+                [(day, mode, entry['sessions'], entry['correct'], entry['total'])
+                 for day, modes in build_rollups(progress['session_history']).items()
+                 for mode, entry in modes.items()])
+            self.insert_drug_stats(progress['drug_performance'])
+            self.set_meta({
+                'schema_version': progress.get('schema_version', 1),
+                'total_questions': progress['total_questions'],
+                'total_correct': progress['total_correct'],
+                'imported': 1,
+            })
+        return True
+
+
+def import_json_progress(json_path, store, replace=True):
+    """Copy a study_progress.json snapshot (and its journal, if any) into a store
+
+    Returns False when there is no JSON progress to import, or when
+    replace=False and the store already holds an import.
+    """
+    from .journal import load_journal
+    from .progress import apply_event, empty_progress
+
+    snapshot, events = load_journal(json_path)
+    if snapshot is None and not events:
+        return False
+
+    # Files written before schema_version existed use positional drug keys
+    progress = dict(empty_progress(), schema_version=1)
+    progress.update(snapshot or {})
+    for event in events:
+        apply_event(progress, event)
+    return store.import_progress(progress, replace)
+
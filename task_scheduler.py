@@ -0,0 +1,159 @@
+# task_scheduler.py - Runs heavy jobs on worker threads and delivers results to the Tk loop
+import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from tkinter import ttk
+
+
+class Task:
+    """Handle for a submitted job"""
+
+    def __init__(self, description, on_done, on_error, on_cancel, cancellable):
+        self.description = description
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_cancel = on_cancel
+        self.cancellable = cancellable
+        self.cancel_event = threading.Event()
+        self.future = None
+        self.delivered = False
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    def cancel(self):
+        """Stop a queued job; a running job stops when it next checks cancel_event"""
+        self.cancel_event.set()
+        self.future.cancel()
+
+
+class ProgressIndicator:
+    """Small busy bar shown in the window corner while tasks run"""
+
+    def __init__(self, root, on_cancel):
+        self.root = root
+        self.on_cancel = on_cancel
+        self.frame = None
+        self.label = None
+        self.cancel_button = None
+
+    def show(self, text, cancellable):
+        """Show (or update) the indicator"""
+        if self.frame is None or not self.frame.winfo_exists():
+            self.frame = ttk.Frame(self.root, padding="6", relief="groove")
+            self.label = ttk.Label(self.frame, font=('Arial', 10))
+            self.label.pack(side="left", padx=(0, 8))
+            bar = ttk.Progressbar(self.frame, mode="indeterminate", length=120)
+            bar.pack(side="left")
+            bar.start(15)
+            self.cancel_button = ttk.Button(self.frame, text="Cancel", command=self.on_cancel)
+
+        self.label.config(text=text)
+        if cancellable:
+            self.cancel_button.pack(side="left", padx=(8, 0))
+        else:
+            self.cancel_button.pack_forget()
+        self.frame.place(relx=1.0, rely=1.0, x=-10, y=-10, anchor="se")
+        self.frame.lift()
+
+    def hide(self):
+        """Remove the indicator"""
+        if self.frame is not None and self.frame.winfo_exists():
+            self.frame.destroy()
+        self.frame = None
+
+
+class TaskScheduler:
+    """Thread pool whose results are handed back to Tk via root.after polling"""
+
+    POLL_MS = 16
+
+    def __init__(self, root, max_workers=2):
+        self.root = root
+        self.executor = ThreadPoolExecutor(max_workers=max_workers,
+                                           thread_name_prefix="study-worker")
+        self.tasks = []
+        self.polling = False
+        self.indicator = ProgressIndicator(root, self.cancel_all)
+
+    def submit(self, fn, *args, on_done=None, on_error=None, on_cancel=None, description=None,
+               cancellable=False):
+        """Run fn(*args) on a worker thread
+
+        on_done(result), on_error(exception) and on_cancel() are called on the
+        Tk thread. Cancellable jobs receive the task's cancel_event as a
+        keyword argument; a cancelled job's result is discarded.
+        Tasks without a description run silently, with no indicator.
+        """
+        task = Task(description, on_done, on_error, on_cancel, cancellable)
+        kwargs = {'cancel_event': task.cancel_event} if cancellable else {}
+        task.future = self.executor.submit(fn, *args, **kwargs)
+        self.tasks.append(task)
+        self.update_indicator()
+
+        if not self.polling:
+            self.polling = True
+            self.root.after(self.POLL_MS, self.poll)
+        return task
+
+    def poll(self):
+        """Deliver finished tasks; keep polling while any are outstanding"""
+        for task in [task for task in self.tasks if task.future.done()]:
+            self.deliver(task)
+
+        if self.tasks:
+            self.root.after(self.POLL_MS, self.poll)
+        else:
+            self.polling = False
+
+    def deliver(self, task):
+        """Run a finished task's callback once on the Tk thread"""
+        if task.delivered:
+            return
+        task.delivered = True
+        if task in self.tasks:
+            self.tasks.remove(task)
+        self.update_indicator()
+
+        try:
+            if task.cancelled:
+                raise CancelledError()
+            result = task.future.result()
+        except CancelledError:
+            if task.on_cancel:
+                task.on_cancel()
+            return
+        except Exception as e:
+            if task.on_error:
+                task.on_error(e)
+            else:
+                print(f"Background task failed: {str(e)}")
+            return
+        if task.on_done:
+            task.on_done(result)
+
+    def update_indicator(self):
+        """Show the indicator for visible tasks, hide it when none remain"""
+        visible = [task for task in self.tasks if task.description and not task.cancelled]
+        if not visible:
+            self.indicator.hide()
+            return
+
+        text = visible[0].description
+        if len(visible) > 1:
+            text += f" (+{len(visible) - 1} more)"
+        self.indicator.show(text, any(task.cancellable for task in visible))
+
+    def cancel_all(self):
+        """Cancel every cancellable task"""
+        for task in self.tasks:
+            if task.cancellable:
+                task.cancel()
+        self.update_indicator()
+
+    def shutdown(self):
+        """Stop cancellable work and wait for the rest, such as saves (used on exit)"""
+        for task in self.tasks:
+            if task.cancellable:
+                task.cancel()
+        self.executor.shutdown(wait=True)
@@ -0,0 +1,100 @@
+# test_progress_import.py - Legacy JSON progress import, drug ID migration and reset
+import json
+import os
+import sys
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from study_core import CATALOG_COLUMNS, Catalog, ProgressManager, make_drug_id
+
+
+def make_catalog(names):
+    """Build a one-section catalog with the given generic names"""
+    columns = {name: [""] * len(names) for name in CATALOG_COLUMNS}
+    columns['Generic Name'] = list(names)
+    columns['Section'] = ["Top 200"] * len(names)
+    return Catalog(columns, [("Top 200", 0, len(names))])
+
+
+def write_legacy_progress(directory):
+    """Write a pre-schema_version snapshot with positional keys plus its journal"""
+    session = {'date': datetime.now().isoformat(), 'mode': 'qa_practice',
+               'total': 4, 'correct': 3, 'accuracy': 75.0}
+    snapshot = {
+        'total_questions': 4,
+        'total_correct': 3,
+        'session_history': [session],
+        'drug_performance': {
+            "0": {'correct': 2, 'total': 2},
+            "1": {'correct': 0, 'total': 1},
+            "9": {'correct': 1, 'total': 1},
+        },
+    }
+    with open(os.path.join(directory, "study_progress.json"), 'w') as f:
+        json.dump(snapshot, f)
+
+    events = [
+        {'op': 'answer', 'drug_id': "1", 'correct': True, 'seq': 1},
+        {'op': 'answer', 'drug_id': "1", 'correct': True, 'hinted': True, 'seq': 2},
+        {'op': 'stats', 'correct': 1, 'total': 1, 'seq': 3},
+        {'op': 'session', 'record': dict(session, total=1, correct=1, accuracy=100.0), 'seq': 4},
+    ]
+    with open(os.path.join(directory, "study_progress.json.journal"), 'w', encoding='utf-8') as f:
+        for event in events:
+            f.write(json.dumps(event) + "\n")
+
+
+def open_progress():
+    """Open the default profile in the current directory"""
+    manager = ProgressManager()
+    manager.load_progress()
+    return manager
+
+
+def test_import_migrate_reset(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write_legacy_progress(tmp_path)
+
+    manager = open_progress()
+    progress = manager.progress
+    assert progress['schema_version'] == 1
+    assert progress['total_questions'] == 5
+    assert progress['total_correct'] == 4
+    assert len(progress['session_history']) == 2
+    # The hinted journal answer does not count
+    assert progress['drug_performance']["1"] == {'correct': 1, 'total': 2}
+
+    # Row 1 was renamed since the progress was written; positional keys follow the row
+    catalog = make_catalog(["Lisinopril", "Atorvastatin calcium", "Metformin"])
+    manager.migrate_drug_ids(catalog)
+    manager.close()
+
+    manager = open_progress()
+    progress = manager.progress
+    assert progress['schema_version'] == 2
+    assert progress['drug_performance'] == {
+        make_drug_id("Lisinopril"): {'correct': 2, 'total': 2},
+        make_drug_id("Atorvastatin calcium"): {'correct': 1, 'total': 2},
+        # Past the end of the catalog: kept as-is rather than dropped
+        "9": {'correct': 1, 'total': 1},
+    }
+    assert progress['total_questions'] == 5
+    assert len(progress['session_history']) == 2
+    assert sum(modes['qa_practice']['sessions'] for modes in progress['daily_rollups'].values()) == 2
+
+    # Already migrated: a second run is a no-op
+    manager.migrate_drug_ids(catalog)
+    assert make_drug_id("Lisinopril") in manager.progress['drug_performance']
+
+    manager.reset_progress()
+    manager.close()
+
+    # The JSON is only imported into a new database, so reset progress stays reset
+    manager = open_progress()
+    progress = manager.progress
+    assert progress['total_questions'] == 0
+    assert progress['drug_performance'] == {}
+    assert len(progress['session_history']) == 0
+    assert progress['daily_rollups'] == {}
+    manager.close()
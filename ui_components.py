@@ -2,6 +2,9 @@
 import tkinter as tk
 from tkinter import ttk
 
+from study_core import rollup_totals
+
+
 class UIComponents:
     """Common UI components and styling utilities"""
     
@@ -30,20 +33,31 @@ class UIComponents:
         progress_frame = ttk.LabelFrame(parent, text="📊 Your Progress", padding="15")
         progress_frame.grid(row=1, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 30))
         
+        value_labels = []
+        for i, (label, value) in enumerate(self.progress_overview_stats(progress_data)):
+            ttk.Label(progress_frame, text=label, font=('Arial', 10, 'bold')).grid(
+                row=0, column=i*2, sticky="w", padx=(0, 5))
+            value_label = ttk.Label(progress_frame, text=str(value), font=('Arial', 10))
+            value_label.grid(row=0, column=i*2+1, sticky="w", padx=(0, 20))
+            value_labels.append(value_label)
+        
+        return value_labels
+    
+    def update_progress_overview(self, value_labels, progress_data):
+        """Refresh the numbers of an existing progress overview"""
+        for value_label, (_, value) in zip(value_labels, self.progress_overview_stats(progress_data)):
+            value_label.config(text=str(value))
+    
+    def progress_overview_stats(self, progress_data):
+        """Return (label, value) pairs for the progress overview"""
         total_accuracy = (progress_data['total_correct'] / max(progress_data['total_questions'], 1)) * 100
         
-        stats = [
+        return [
             ("Questions:", progress_data['total_questions']),
             ("Correct:", progress_data['total_correct']),
             ("Accuracy:", f"{total_accuracy:.1f}%"),
-            ("Sessions:", len(progress_data['session_history']))
+            ("Sessions:", rollup_totals(progress_data['daily_rollups'])['sessions'])
         ]
-        
-        for i, (label, value) in enumerate(stats):
-            ttk.Label(progress_frame, text=label, font=('Arial', 10, 'bold')).grid(
-                row=0, column=i*2, sticky="w", padx=(0, 5))
-            ttk.Label(progress_frame, text=str(value), font=('Arial', 10)).grid(
-                row=0, column=i*2+1, sticky="w", padx=(0, 20))
     
     def create_menu_buttons(self, parent, button_data):
         """Create menu buttons with descriptions"""
@@ -76,7 +90,13 @@ class UIComponents:
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
-        # Mousewheel binding
-        canvas.bind_all("<MouseWheel>", lambda e: canvas.yview_scroll(int(-1*(e.delta/120)), "units"))
+        self.bind_mousewheel(canvas)
         
         return scrollable_frame
+    
+    def bind_mousewheel(self, canvas):
+        """Scroll canvas with the mousewheel while the pointer is over it"""
+        # Bound globally only on <Enter>, since several cached screens may each own a scrolling canvas
+        scroll = lambda e: canvas.yview_scroll(int(-1*(e.delta/120)), "units")
+        canvas.bind("<Enter>", lambda e: canvas.bind_all("<MouseWheel>", scroll))
+        canvas.bind("<Leave>", lambda e: canvas.unbind_all("<MouseWheel>"))
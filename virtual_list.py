@@ -0,0 +1,163 @@
+# virtual_list.py - Virtualized, collapsible drug checklist backed by the selection model
+import tkinter as tk
+from bisect import bisect_right
+from tkinter import ttk
+
+
+class RowSlot:
+    """One recycled row widget: collapse toggle + checkbutton"""
+
+    def __init__(self, parent, on_toggle, on_check):
+        self.frame = ttk.Frame(parent)
+        self.var = tk.BooleanVar()
+        self.toggle = ttk.Button(self.frame, width=2, command=lambda: on_toggle(self))
+        self.check = ttk.Checkbutton(self.frame, variable=self.var, command=lambda: on_check(self))
+        self.toggle.grid(row=0, column=0, padx=(0, 6))
+        self.check.grid(row=0, column=1, sticky="w")
+        self.item = None
+        self.window = None
+        self.is_header = None
+
+
+class VirtualDrugList:
+    """Canvas-hosted checklist that only creates widgets for visible rows
+
+    Rows are section headers followed by that section's drugs (unless the
+    section is collapsed). Row positions are derived from per-section offsets,
+    so opening and scrolling cost depends on the window height, not on the
+    number of drugs.
+    """
+
+    ROW_HEIGHT = 28
+    OVERSCAN = 2
+
+    def __init__(self, parent, ui_components, catalog, selection):
+        self.catalog = catalog
+        self.selection = selection
+        self.section_names = list(catalog.section_index)
+        self.collapsed = set()
+        self.offsets = []
+        self.total_rows = 0
+        self.slots = []
+
+        self.frame = ttk.Frame(parent)
+        self.canvas = tk.Canvas(self.frame, highlightthickness=0)
+        self.scrollbar = ttk.Scrollbar(self.frame, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self.on_view_changed)
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.canvas.bind("<Configure>", lambda e: self.refresh())
+        ui_components.bind_mousewheel(self.canvas)
+
+        generic_names = catalog.columns['Generic Name']
+        brand_names = catalog.columns['Brand Name(s)']
+        self.drug_text = lambda idx: f"{generic_names[idx]} ({brand_names[idx]})"
+
+        self.layout()
+
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+
+    def layout(self):
+        """Recompute section offsets and the scroll region (O(sections))"""
+        self.offsets = []
+        row = 0
+        for name in self.section_names:
+            self.offsets.append(row)
+            row += 1
+            if name not in self.collapsed:
+                row += self.catalog.section_size(name)
+        self.total_rows = row
+        self.canvas.configure(scrollregion=(0, 0, 1, self.total_rows * self.ROW_HEIGHT),
+                              yscrollincrement=self.ROW_HEIGHT)
+        self.refresh()
+
+    def item_at(self, row):
+        """Return ('section', name) or ('drug', catalog row) for a virtual row"""
+        i = bisect_right(self.offsets, row) - 1
+        name = self.section_names[i]
+        local = row - self.offsets[i]
+        if local == 0:
+            return ('section', name)
+
+        local -= 1
+        for start, stop in self.catalog.section_index[name]:
+            if local < stop - start:
+                return ('drug', start + local)
+            local -= stop - start
+        raise IndexError(row)
+
+    def on_view_changed(self, first, last):
+        """Scrollbar callback from the canvas; re-fill the visible rows"""
+        self.scrollbar.set(first, last)
+        self.refresh()
+
+    def refresh(self):
+        """Point the slot pool at the rows currently in view"""
+        height = max(self.canvas.winfo_height(), 1)
+        width = max(self.canvas.winfo_width(), 1)
+        first = max(int(self.canvas.canvasy(0)) // self.ROW_HEIGHT, 0)
+        count = min(height // self.ROW_HEIGHT + self.OVERSCAN, max(self.total_rows - first, 0))
+
+        while len(self.slots) < count:
+            slot = RowSlot(self.canvas, self.toggle_collapse, self.toggle_check)
+            slot.window = self.canvas.create_window(0, 0, window=slot.frame, anchor="nw")
+            self.slots.append(slot)
+
+        for i, slot in enumerate(self.slots):
+            if i >= count:
+                self.canvas.itemconfigure(slot.window, state="hidden")
+                slot.item = None
+                continue
+            row = first + i
+            self.bind_slot(slot, self.item_at(row))
+            self.canvas.coords(slot.window, 10, row * self.ROW_HEIGHT)
+            self.canvas.itemconfigure(slot.window, state="normal", width=width - 20)
+
+    def bind_slot(self, slot, item):
+        """Reconfigure a recycled slot for a row"""
+        kind, key = item
+        is_header = kind == 'section'
+        if slot.is_header != is_header:
+            if is_header:
+                slot.toggle.grid()
+                slot.check.grid_configure(padx=0)
+            else:
+                slot.toggle.grid_remove()
+                slot.check.grid_configure(padx=(40, 0))
+            slot.is_header = is_header
+
+        slot.item = item
+        if is_header:
+            slot.toggle.config(text="▸" if key in self.collapsed else "▾")
+            text = f"{key} ({self.catalog.section_size(key)} drugs)"
+            slot.var.set(self.selection.is_section_selected(key))
+        else:
+            text = self.drug_text(key)
+            text = text[:60] + "..." if len(text) > 60 else text
+            slot.var.set(self.selection.is_drug_selected(key))
+        slot.check.config(text=text)
+
+    def toggle_collapse(self, slot):
+        """Collapse or expand a section"""
+        kind, name = slot.item
+        if name in self.collapsed:
+            self.collapsed.discard(name)
+        else:
+            self.collapsed.add(name)
+        self.layout()
+
+    def toggle_check(self, slot):
+        """Write a checkbutton change through to the selection model"""
+        kind, key = slot.item
+        if kind == 'section':
+            self.selection.set_section(key, slot.var.get())
+            self.refresh()
+        else:
+            self.selection.set_drug(key, slot.var.get())
+
+    def set_all_collapsed(self, collapsed):
+        """Collapse or expand every section"""
+        self.collapsed = set(self.section_names) if collapsed else set()
+        self.layout()